@@ -115,6 +115,7 @@
 
           # MCP (Model Context Protocol)
           mcp
+          uvloop  # Faster event loop for the MCP server
 
           # Push notifications
           pywebpush
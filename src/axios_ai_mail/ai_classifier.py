@@ -247,7 +247,7 @@ RESPOND WITH ONLY A JSON OBJECT (no markdown, no explanation):
                 confidence = 0.8
 
             classification = Classification(
-                tags=tags,
+                tags=tuple(tags),
                 priority=priority,
                 todo=todo,
                 can_archive=can_archive,
@@ -274,7 +274,7 @@ RESPOND WITH ONLY A JSON OBJECT (no markdown, no explanation):
             logger.error(f"Failed to parse LLM response for message {message.id}: {e}")
             # Return default classification with low confidence
             return Classification(
-                tags=["personal"],
+                tags=("personal",),
                 priority="normal",
                 todo=False,
                 can_archive=False,
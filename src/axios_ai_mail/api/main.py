@@ -11,7 +11,8 @@ from fastapi.staticfiles import StaticFiles
 from ..config.loader import ConfigLoader
 from ..db.database import Database
 from ..ai_classifier import AIClassifier, AIConfig
-from ..providers.connection_pool import shutdown_connection_pool
+from ..providers.connection_pool import get_connection_pool, shutdown_connection_pool
+from ..providers.factory import ProviderFactory
 from ..providers.imap_idle import get_idle_watcher, shutdown_idle_watcher, IdleConfig
 from .routes.sync import _sync_executor
 from .routes import accounts, actions, attachments, contacts, drafts, feedback, maintenance, messages, push, send, stats, sync, trusted_senders
@@ -191,6 +192,36 @@ def _setup_idle_watchers(config: dict):
         logger.info(f"IMAP IDLE watchers started for: {', '.join(watched)}")
 
 
+def _warm_connection_pool(db: Database):
+    """Open pooled IMAP connections for all IMAP accounts.
+
+    Runs in a worker thread at startup so the first sync cycle reuses an
+    authenticated connection instead of paying for TLS and LOGIN inline.
+
+    Args:
+        db: Database with the configured accounts
+    """
+    specs = []
+    for account in db.list_accounts():
+        if account.provider != "imap":
+            continue
+        try:
+            provider = ProviderFactory.create_from_account(account)
+        except Exception as e:
+            logger.warning(f"Skipping connection pre-warm for {account.id}: {e}")
+            continue
+        specs.append((account.id, provider.create_connection))
+
+    if specs:
+        get_connection_pool().warm_up(specs)
+
+
+def _log_warm_up_failure(future) -> None:
+    """Report an exception from the background connection pre-warm."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"IMAP connection pre-warm failed: {future.exception()}")
+
+
 # Track last IDLE-triggered sync time per account (debounce)
 _idle_sync_times: dict = {}
 IDLE_SYNC_DEBOUNCE_SECONDS = 30  # Don't sync same account more than once per 30s
@@ -285,6 +316,12 @@ async def startup_event():
         # Initialize IMAP IDLE watchers for IMAP accounts
         _setup_idle_watchers(config)
 
+        # Open pooled IMAP connections in the background; startup doesn't wait
+        warm_up = app.state.event_loop.run_in_executor(
+            None, _warm_connection_pool, app.state.db
+        )
+        warm_up.add_done_callback(_log_warm_up_failure)
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
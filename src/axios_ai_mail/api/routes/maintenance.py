@@ -27,7 +27,7 @@ def db_message_to_provider_message(db_msg) -> ProviderMessage:
         snippet=db_msg.snippet or "",
         body_text=db_msg.body_text,
         body_html=db_msg.body_html,
-        labels=set(db_msg.provider_labels or []),
+        labels=frozenset(db_msg.provider_labels or ()),
         is_unread=db_msg.is_unread,
         folder=db_msg.folder or "inbox",
     )
@@ -186,7 +186,7 @@ async def run_reclassify(
                         # Update classification in database
                         db.store_classification(
                             message_id=message.id,
-                            tags=result.tags,
+                            tags=list(result.tags),
                             priority=result.priority,
                             todo=result.todo,
                             can_archive=result.can_archive,
@@ -1026,7 +1026,7 @@ async def get_smart_replies(request: Request, message_id: str):
             body_html=message.body_html,
             is_unread=message.is_unread,
             has_attachments=message.has_attachments,
-            labels=set(message.provider_labels) if message.provider_labels else set(),
+            labels=frozenset(message.provider_labels or ()),
         )
 
         # Generate replies using AI classifier
@@ -4,7 +4,7 @@ import logging
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Generator, List, Optional
+from typing import Dict, Generator, List, Optional, Set
 
 from sqlalchemy import create_engine, delete, event, select, String, text
 from sqlalchemy.engine import Engine
@@ -563,6 +563,28 @@ class Database:
             classification = session.get(Classification, message_id)
             return classification is not None
 
+    def get_classified_message_ids(
+        self, account_id: str, since: Optional[datetime] = None
+    ) -> Set[str]:
+        """Get IDs of an account's messages that are stored and classified.
+
+        Args:
+            account_id: Account to query
+            since: Only include messages dated on or after this time
+
+        Returns:
+            Set of message IDs
+        """
+        with self.session() as session:
+            query = (
+                select(Message.id)
+                .join(Classification, Classification.message_id == Message.id)
+                .where(Message.account_id == account_id)
+            )
+            if since:
+                query = query.where(Message.date >= since)
+            return set(session.execute(query).scalars())
+
     def store_classification(
         self,
         message_id: str,
@@ -5,6 +5,7 @@ decoupling MCP logic from API implementation.
 """
 
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -13,6 +14,9 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# How long an account snapshot is reused before the account list is refetched
+ACCOUNTS_CACHE_TTL = 60.0
+
 
 class APIError(Exception):
     """Error from the axios-ai-mail API."""
@@ -46,6 +50,29 @@ class Account:
     last_sync: datetime | None = None
 
 
+@dataclass(frozen=True)
+class AccountSnapshot:
+    """Account list plus views derived from it, computed once per fetch."""
+
+    accounts: tuple[Account, ...]
+    emails_lower: frozenset[str]
+
+    @classmethod
+    def from_accounts(cls, accounts: tuple[Account, ...]) -> "AccountSnapshot":
+        """Build a snapshot from a fetched account list.
+
+        Args:
+            accounts: Accounts returned by the API
+
+        Returns:
+            AccountSnapshot with derived lookups
+        """
+        return cls(
+            accounts=accounts,
+            emails_lower=frozenset(acc.email.lower() for acc in accounts),
+        )
+
+
 @dataclass
 class Message:
     """Email message."""
@@ -99,7 +126,19 @@ class AxiosMailClient:
             base_url: Base URL of the axios-ai-mail API
         """
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=30.0)
+        # One client for the lifetime of the server so every tool call reuses
+        # pooled keep-alive connections instead of reconnecting per request
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+        self._accounts_snapshot: AccountSnapshot | None = None
+        self._accounts_fetched_at = 0.0
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -153,14 +192,37 @@ class AxiosMailClient:
 
     # Account operations
 
-    async def list_accounts(self) -> list[Account]:
+    async def list_accounts(self) -> tuple[Account, ...]:
         """List all configured email accounts.
 
         Returns:
-            List of Account objects
+            Tuple of Account objects (an immutable snapshot, safe to share)
+        """
+        snapshot = await self._fetch_account_snapshot()
+        return snapshot.accounts
+
+    async def get_account_snapshot(self) -> AccountSnapshot:
+        """Get the account list with derived lookups, cached for ACCOUNTS_CACHE_TTL.
+
+        Use this where slightly stale account data is fine (e.g. recognising
+        our own addresses); use list_accounts() for up-to-date sync times.
+
+        Returns:
+            AccountSnapshot for the configured accounts
+        """
+        snapshot = self._accounts_snapshot
+        if snapshot is None or time.monotonic() - self._accounts_fetched_at > ACCOUNTS_CACHE_TTL:
+            snapshot = await self._fetch_account_snapshot()
+        return snapshot
+
+    async def _fetch_account_snapshot(self) -> AccountSnapshot:
+        """Fetch accounts from the API and refresh the cached snapshot.
+
+        Returns:
+            Freshly built AccountSnapshot
         """
         data = await self._request("GET", "/api/accounts")
-        return [
+        accounts = tuple(
             Account(
                 id=acc["id"],
                 name=acc["name"],
@@ -171,7 +233,12 @@ class AxiosMailClient:
                 else None,
             )
             for acc in data
-        ]
+        )
+
+        snapshot = AccountSnapshot.from_accounts(accounts)
+        self._accounts_snapshot = snapshot
+        self._accounts_fetched_at = time.monotonic()
+        return snapshot
 
     # Message operations
 
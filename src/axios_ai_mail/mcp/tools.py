@@ -4,12 +4,15 @@ This module contains all the MCP tools that expose email operations
 to AI assistants.
 """
 
+import asyncio
+import functools
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
-from .client import APIConnectionError, APIError, AxiosMailClient
+from .client import Account, APIError, AxiosMailClient, Draft
 from .utils import (
     AccountResolutionError,
     normalize_email_list,
@@ -18,6 +21,89 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# Bulk operations are split into requests of at most this many message IDs
+BULK_CHUNK_SIZE = 100
+
+# Maximum number of bulk chunk requests in flight at once
+BULK_MAX_CONCURRENCY = 4
+
+
+def _handle_tool_errors(
+    fn: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """Convert API and account resolution errors raised by a tool into error dicts.
+
+    APIConnectionError is a subclass of APIError, so both are covered here.
+
+    Args:
+        fn: Async tool function to wrap
+
+    Returns:
+        Wrapped tool function with the same signature and docstring
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await fn(*args, **kwargs)
+        except AccountResolutionError as e:
+            return {"error": str(e), "available_accounts": e.available_accounts}
+        except APIError as e:
+            return {"error": str(e)}
+
+    return wrapper
+
+
+async def _bulk_request(
+    call: Callable[[list[str]], Awaitable[dict[str, Any]]],
+    ids: list[str],
+) -> dict[str, Any]:
+    """Run a bulk API call in chunks of BULK_CHUNK_SIZE message IDs.
+
+    Chunks are sent concurrently (at most BULK_MAX_CONCURRENCY at a time) and
+    their results merged: integer counts are summed and error lists joined.
+    A chunk that fails contributes one error per message ID; if every chunk
+    fails, the first error is raised.
+
+    Args:
+        call: Client method bound to everything except the message IDs
+        ids: Message IDs to process
+
+    Returns:
+        Merged result dict in the same shape as a single bulk response
+    """
+    if len(ids) <= BULK_CHUNK_SIZE:
+        return await call(ids)
+
+    chunks = [ids[i : i + BULK_CHUNK_SIZE] for i in range(0, len(ids), BULK_CHUNK_SIZE)]
+    semaphore = asyncio.Semaphore(BULK_MAX_CONCURRENCY)
+
+    async def run_chunk(chunk: list[str]) -> dict[str, Any]:
+        async with semaphore:
+            return await call(chunk)
+
+    results = await asyncio.gather(*(run_chunk(c) for c in chunks), return_exceptions=True)
+
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if len(failures) == len(results):
+        raise failures[0]
+
+    merged: dict[str, Any] = {"errors": []}
+    for chunk, result in zip(chunks, results, strict=True):
+        if isinstance(result, BaseException):
+            merged["errors"].extend(
+                {"message_id": message_id, "error": str(result)} for message_id in chunk
+            )
+            continue
+        for key, value in result.items():
+            if key == "errors":
+                merged["errors"].extend(value)
+            elif isinstance(value, int) and not isinstance(value, bool):
+                merged[key] = merged.get(key, 0) + value
+
+    merged["total"] = len(ids)
+    return merged
+
 
 def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
     """Register all MCP tools with the server.
@@ -28,6 +114,7 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
     """
 
     @mcp.tool()
+    @_handle_tool_errors
     async def list_accounts() -> list[dict[str, Any]]:
         """List all configured email accounts.
 
@@ -37,24 +124,20 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
         Returns:
             List of accounts with id, name, email, and provider fields.
         """
-        try:
-            accounts = await client.list_accounts()
-            return [
-                {
-                    "id": acc.id,
-                    "name": acc.name,
-                    "email": acc.email,
-                    "provider": acc.provider,
-                    "last_sync": acc.last_sync.isoformat() if acc.last_sync else None,
-                }
-                for acc in accounts
-            ]
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        accounts = await client.list_accounts()
+        return [
+            {
+                "id": acc.id,
+                "name": acc.name,
+                "email": acc.email,
+                "provider": acc.provider,
+                "last_sync": acc.last_sync.isoformat() if acc.last_sync else None,
+            }
+            for acc in accounts
+        ]
 
     @mcp.tool()
+    @_handle_tool_errors
     async def search_emails(
         query: str | None = None,
         account: str | None = None,
@@ -77,50 +160,42 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
             Dict with 'messages' list and 'total' count.
             Each message has id, subject, from_email, date, snippet, is_unread.
         """
-        try:
-            # Resolve account if specified
-            account_id = None
-            if account:
-                accounts = await client.list_accounts()
-                try:
-                    resolved = resolve_account(account, accounts)
-                    account_id = resolved.id
-                except AccountResolutionError as e:
-                    return {"error": str(e), "available_accounts": e.available_accounts}
-
-            messages, total = await client.search_messages(
-                account_id=account_id,
-                folder=folder,
-                is_unread=unread_only if unread_only else None,
-                tag=tag,
-                search=query,
-                limit=limit,
-            )
-
-            return {
-                "messages": [
-                    {
-                        "id": msg.id,
-                        "account_id": msg.account_id,
-                        "subject": msg.subject,
-                        "from_email": msg.from_email,
-                        "date": msg.date.isoformat(),
-                        "snippet": msg.snippet,
-                        "is_unread": msg.is_unread,
-                        "tags": msg.tags,
-                        "has_attachments": msg.has_attachments,
-                    }
-                    for msg in messages
-                ],
-                "total": total,
-                "limit": limit,
-            }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        # Resolve account if specified
+        account_id = None
+        if account:
+            accounts = await client.list_accounts()
+            account_id = resolve_account(account, accounts).id
+
+        messages, total = await client.search_messages(
+            account_id=account_id,
+            folder=folder,
+            is_unread=unread_only if unread_only else None,
+            tag=tag,
+            search=query,
+            limit=limit,
+        )
+
+        return {
+            "messages": [
+                {
+                    "id": msg.id,
+                    "account_id": msg.account_id,
+                    "subject": msg.subject,
+                    "from_email": msg.from_email,
+                    "date": msg.date.isoformat(),
+                    "snippet": msg.snippet,
+                    "is_unread": msg.is_unread,
+                    "tags": msg.tags,
+                    "has_attachments": msg.has_attachments,
+                }
+                for msg in messages
+            ],
+            "total": total,
+            "limit": limit,
+        }
 
     @mcp.tool()
+    @_handle_tool_errors
     async def read_email(message_id: str) -> dict[str, Any]:
         """Get the full content of an email by ID.
 
@@ -131,33 +206,58 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
             Full email content including subject, sender, recipients, date,
             body text, and attachment info.
         """
-        try:
-            # Get message metadata
-            message = await client.get_message(message_id)
+        # Get message metadata
+        message = await client.get_message(message_id)
+
+        # Get full body
+        body = await client.get_message_body(message_id)
+
+        return {
+            "id": message.id,
+            "account_id": message.account_id,
+            "subject": message.subject,
+            "from_email": message.from_email,
+            "to_emails": message.to_emails,
+            "date": message.date.isoformat(),
+            "is_unread": message.is_unread,
+            "thread_id": message.thread_id,
+            "tags": message.tags,
+            "has_attachments": message.has_attachments,
+            "body_text": body.body_text,
+            "body_html": body.body_html,
+        }
+
+    async def _create_draft(
+        account: str | None,
+        to_emails: list[str],
+        subject: str,
+        body: str,
+        cc_emails: list[str],
+        bcc_emails: list[str],
+    ) -> tuple[Draft, Account]:
+        """Resolve the sending account and create a draft.
 
-            # Get full body
-            body = await client.get_message_body(message_id)
+        Shared by compose_email and send_email so compose-and-send resolves
+        the account once and works with the Draft directly.
 
-            return {
-                "id": message.id,
-                "account_id": message.account_id,
-                "subject": message.subject,
-                "from_email": message.from_email,
-                "to_emails": message.to_emails,
-                "date": message.date.isoformat(),
-                "is_unread": message.is_unread,
-                "thread_id": message.thread_id,
-                "tags": message.tags,
-                "has_attachments": message.has_attachments,
-                "body_text": body.body_text,
-                "body_html": body.body_html,
-            }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        Returns:
+            Tuple of (created draft, resolved account)
+        """
+        accounts = await client.list_accounts()
+        resolved = resolve_account(account, accounts)
+
+        draft = await client.create_draft(
+            account_id=resolved.id,
+            to_emails=to_emails,
+            subject=subject,
+            body_text=body,
+            cc_emails=cc_emails if cc_emails else None,
+            bcc_emails=bcc_emails if bcc_emails else None,
+        )
+        return draft, resolved
 
     @mcp.tool()
+    @_handle_tool_errors
     async def compose_email(
         to: str | list[str],
         subject: str,
@@ -181,46 +281,29 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
         Returns:
             Dict with draft_id for use with send_email.
         """
-        try:
-            # Resolve account
-            accounts = await client.list_accounts()
-            try:
-                resolved = resolve_account(account, accounts)
-            except AccountResolutionError as e:
-                return {"error": str(e), "available_accounts": e.available_accounts}
-
-            # Normalize email lists
-            to_emails = normalize_email_list(to)
-            cc_emails = normalize_email_list(cc)
-            bcc_emails = normalize_email_list(bcc)
-
-            if not to_emails:
-                return {"error": "At least one recipient (to) is required."}
-
-            # Create draft
-            draft = await client.create_draft(
-                account_id=resolved.id,
-                to_emails=to_emails,
-                subject=subject,
-                body_text=body,
-                cc_emails=cc_emails if cc_emails else None,
-                bcc_emails=bcc_emails if bcc_emails else None,
-            )
-
-            return {
-                "draft_id": draft.id,
-                "account": resolved.name,
-                "to": to_emails,
-                "subject": subject,
-                "status": "draft_created",
-                "message": f"Draft created. Use send_email(draft_id='{draft.id}') to send.",
-            }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        # Normalize email lists
+        to_emails = normalize_email_list(to)
+        cc_emails = normalize_email_list(cc)
+        bcc_emails = normalize_email_list(bcc)
+
+        if not to_emails:
+            return {"error": "At least one recipient (to) is required."}
+
+        draft, resolved = await _create_draft(
+            account, to_emails, subject, body, cc_emails, bcc_emails
+        )
+
+        return {
+            "draft_id": draft.id,
+            "account": resolved.name,
+            "to": to_emails,
+            "subject": subject,
+            "status": "draft_created",
+            "message": f"Draft created. Use send_email(draft_id='{draft.id}') to send.",
+        }
 
     @mcp.tool()
+    @_handle_tool_errors
     async def send_email(
         draft_id: str | None = None,
         to: str | list[str] | None = None,
@@ -249,14 +332,18 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
             (to, cc, bcc, subject, body, account) so the AI can report
             what was sent without needing to query the message.
         """
+        # Draft created by compose-and-send, deleted again if sending fails
+        new_draft_id: str | None = None
+
         try:
             # If draft_id provided, send the existing draft
             if draft_id:
-                # Fetch draft content BEFORE sending (draft is deleted after send)
-                draft = await client.get_draft(draft_id)
-
-                # Resolve account name for display
-                accounts = await client.list_accounts()
+                # Fetch draft content BEFORE sending (draft is deleted after send),
+                # together with the accounts used to resolve its display name
+                draft, accounts = await asyncio.gather(
+                    client.get_draft(draft_id),
+                    client.list_accounts(),
+                )
                 account_name = next(
                     (acc.name for acc in accounts if acc.id == draft.account_id),
                     draft.account_id,
@@ -282,49 +369,41 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
                     "to compose and send in one step."
                 }
 
-            # Create draft first
-            compose_result = await compose_email(
-                to=to,
-                subject=subject,
-                body=body,
-                account=account,
-                cc=cc,
-                bcc=bcc,
-            )
+            to_emails = normalize_email_list(to)
+            cc_emails = normalize_email_list(cc)
+            bcc_emails = normalize_email_list(bcc)
 
-            if "error" in compose_result:
-                return compose_result
+            if not to_emails:
+                return {"error": "At least one recipient (to) is required."}
 
-            # Send the draft
-            new_draft_id = compose_result["draft_id"]
+            # Create the draft, then send it
+            draft, resolved = await _create_draft(
+                account, to_emails, subject, body, cc_emails, bcc_emails
+            )
+            new_draft_id = draft.id
             result = await client.send_draft(new_draft_id)
 
-            # Normalize cc/bcc for response
-            cc_emails = normalize_email_list(cc)
-            bcc_emails = normalize_email_list(bcc)
-
             return {
                 "message_id": result.get("message_id"),
                 "status": "sent",
-                "account": compose_result["account"],
-                "to": compose_result["to"],
+                "account": resolved.name,
+                "to": to_emails,
                 "cc": cc_emails if cc_emails else None,
                 "bcc": bcc_emails if bcc_emails else None,
                 "subject": subject,
                 "body": body,
             }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
+        except APIError:
             # If send failed, try to clean up draft
-            if draft_id is None and "new_draft_id" in dir():
+            if new_draft_id is not None:
                 try:
                     await client.delete_draft(new_draft_id)
                 except Exception:
                     pass
-            return {"error": str(e)}
+            raise
 
     @mcp.tool()
+    @_handle_tool_errors
     async def reply_to_email(
         message_id: str,
         body: str,
@@ -340,55 +419,49 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
         Returns:
             Dict with draft_id. Use send_email to send the reply.
         """
-        try:
-            # Get original message
-            original = await client.get_message(message_id)
-
-            # Build reply subject
-            subject = original.subject
-            if not subject.lower().startswith("re:"):
-                subject = f"Re: {subject}"
-
-            # Determine recipients
-            to_emails = [original.from_email]
-
-            if reply_all:
-                # Add original TO recipients (excluding our own email)
-                accounts = await client.list_accounts()
-                our_emails = {acc.email.lower() for acc in accounts}
-
-                for email in original.to_emails:
-                    if email.lower() not in our_emails and email not in to_emails:
-                        to_emails.append(email)
-
-            # Find the account that received this message
-            accounts = await client.list_accounts()
-            account_id = original.account_id
-
-            # Create reply draft
-            draft = await client.create_draft(
-                account_id=account_id,
-                to_emails=to_emails,
-                subject=subject,
-                body_text=body,
-                thread_id=original.thread_id,
-                in_reply_to=message_id,
-            )
-
-            return {
-                "draft_id": draft.id,
-                "to": to_emails,
-                "subject": subject,
-                "reply_all": reply_all,
-                "status": "draft_created",
-                "message": f"Reply draft created. Use send_email(draft_id='{draft.id}') to send.",
-            }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        # Get original message
+        original = await client.get_message(message_id)
+
+        # Build reply subject
+        subject = original.subject
+        if not subject.lower().startswith("re:"):
+            subject = f"Re: {subject}"
+
+        # Determine recipients
+        to_emails = [original.from_email]
+
+        if reply_all:
+            # Add original TO recipients (excluding our own email)
+            our_emails = (await client.get_account_snapshot()).emails_lower
+
+            for email in original.to_emails:
+                if email.lower() not in our_emails and email not in to_emails:
+                    to_emails.append(email)
+
+        # Reply from the account that received this message
+        account_id = original.account_id
+
+        # Create reply draft
+        draft = await client.create_draft(
+            account_id=account_id,
+            to_emails=to_emails,
+            subject=subject,
+            body_text=body,
+            thread_id=original.thread_id,
+            in_reply_to=message_id,
+        )
+
+        return {
+            "draft_id": draft.id,
+            "to": to_emails,
+            "subject": subject,
+            "reply_all": reply_all,
+            "status": "draft_created",
+            "message": f"Reply draft created. Use send_email(draft_id='{draft.id}') to send.",
+        }
 
     @mcp.tool()
+    @_handle_tool_errors
     async def mark_read(
         message_ids: str | list[str],
         unread: bool = False,
@@ -402,28 +475,24 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
         Returns:
             Dict with count of updated messages.
         """
-        try:
-            # Normalize to list
-            if isinstance(message_ids, str):
-                ids = [message_ids]
-            else:
-                ids = list(message_ids)
-
-            result = await client.mark_read(ids, is_unread=unread)
-
-            action = "unread" if unread else "read"
-            return {
-                "updated": result.get("updated", 0),
-                "total": result.get("total", len(ids)),
-                "action": f"marked_as_{action}",
-                "errors": result.get("errors", []),
-            }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        # Normalize to list
+        if isinstance(message_ids, str):
+            ids = [message_ids]
+        else:
+            ids = list(message_ids)
+
+        result = await _bulk_request(lambda chunk: client.mark_read(chunk, is_unread=unread), ids)
+
+        action = "unread" if unread else "read"
+        return {
+            "updated": result.get("updated", 0),
+            "total": result.get("total", len(ids)),
+            "action": f"marked_as_{action}",
+            "errors": result.get("errors", []),
+        }
 
     @mcp.tool()
+    @_handle_tool_errors
     async def delete_email(
         message_ids: str | list[str],
         permanent: bool = False,
@@ -437,35 +506,33 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
         Returns:
             Dict with count of deleted messages.
         """
-        try:
-            # Normalize to list
-            if isinstance(message_ids, str):
-                ids = [message_ids]
-            else:
-                ids = list(message_ids)
+        # Normalize to list
+        if isinstance(message_ids, str):
+            ids = [message_ids]
+        else:
+            ids = list(message_ids)
 
-            result = await client.delete_messages(ids, permanent=permanent)
+        result = await _bulk_request(
+            lambda chunk: client.delete_messages(chunk, permanent=permanent), ids
+        )
 
-            if permanent:
-                return {
-                    "deleted": result.get("deleted", 0),
-                    "total": result.get("total", len(ids)),
-                    "action": "permanently_deleted",
-                    "errors": result.get("errors", []),
-                }
-            else:
-                return {
-                    "moved_to_trash": result.get("moved_to_trash", 0),
-                    "total": result.get("total", len(ids)),
-                    "action": "moved_to_trash",
-                    "errors": result.get("errors", []),
-                }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        if permanent:
+            return {
+                "deleted": result.get("deleted", 0),
+                "total": result.get("total", len(ids)),
+                "action": "permanently_deleted",
+                "errors": result.get("errors", []),
+            }
+        else:
+            return {
+                "moved_to_trash": result.get("moved_to_trash", 0),
+                "total": result.get("total", len(ids)),
+                "action": "moved_to_trash",
+                "errors": result.get("errors", []),
+            }
 
     @mcp.tool()
+    @_handle_tool_errors
     async def update_tags(
         message_id: str,
         tags: list[str],
@@ -483,19 +550,15 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
         Returns:
             Updated message with new tags.
         """
-        try:
-            result = await client.update_tags(message_id, tags)
-            return {
-                "id": result.get("id", message_id),
-                "tags": result.get("tags", tags),
-                "status": "tags_updated",
-            }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        result = await client.update_tags(message_id, tags)
+        return {
+            "id": result.get("id", message_id),
+            "tags": result.get("tags", tags),
+            "status": "tags_updated",
+        }
 
     @mcp.tool()
+    @_handle_tool_errors
     async def bulk_update_tags(
         message_ids: list[str],
         tags: list[str],
@@ -513,21 +576,17 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
         Returns:
             Dict with count of updated messages and any errors.
         """
-        try:
-            result = await client.bulk_update_tags(message_ids, tags)
-            return {
-                "updated": result.get("updated", 0),
-                "total": result.get("total", len(message_ids)),
-                "tags": tags,
-                "action": "tags_updated",
-                "errors": result.get("errors", []),
-            }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        result = await client.bulk_update_tags(message_ids, tags)
+        return {
+            "updated": result.get("updated", 0),
+            "total": result.get("total", len(message_ids)),
+            "tags": tags,
+            "action": "tags_updated",
+            "errors": result.get("errors", []),
+        }
 
     @mcp.tool()
+    @_handle_tool_errors
     async def delete_by_filter(
         tag: str | None = None,
         folder: str | None = None,
@@ -546,40 +605,32 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
         Returns:
             Dict with count of messages moved to trash.
         """
-        try:
-            if not tag and not folder and not account:
-                return {
-                    "error": "At least one filter (tag, folder, or account) is required "
-                    "to prevent accidental deletion of all messages."
-                }
-
-            # Resolve account if specified
-            account_id = None
-            if account:
-                accounts = await client.list_accounts()
-                try:
-                    resolved = resolve_account(account, accounts)
-                    account_id = resolved.id
-                except AccountResolutionError as e:
-                    return {"error": str(e), "available_accounts": e.available_accounts}
-
-            result = await client.delete_by_filter(
-                tag=tag,
-                folder=folder,
-                account_id=account_id,
-            )
+        if not tag and not folder and not account:
             return {
-                "moved_to_trash": result.get("moved_to_trash", 0),
-                "total": result.get("total", 0),
-                "action": "moved_to_trash",
-                "errors": result.get("errors", []),
+                "error": "At least one filter (tag, folder, or account) is required "
+                "to prevent accidental deletion of all messages."
             }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+
+        # Resolve account if specified
+        account_id = None
+        if account:
+            accounts = await client.list_accounts()
+            account_id = resolve_account(account, accounts).id
+
+        result = await client.delete_by_filter(
+            tag=tag,
+            folder=folder,
+            account_id=account_id,
+        )
+        return {
+            "moved_to_trash": result.get("moved_to_trash", 0),
+            "total": result.get("total", 0),
+            "action": "moved_to_trash",
+            "errors": result.get("errors", []),
+        }
 
     @mcp.tool()
+    @_handle_tool_errors
     async def restore_email(
         message_ids: str | list[str],
     ) -> dict[str, Any]:
@@ -591,25 +642,21 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
         Returns:
             Dict with count of restored messages.
         """
-        try:
-            if isinstance(message_ids, str):
-                ids = [message_ids]
-            else:
-                ids = list(message_ids)
-
-            result = await client.restore_messages(ids)
-            return {
-                "restored": result.get("restored", 0),
-                "total": result.get("total", len(ids)),
-                "action": "restored_from_trash",
-                "errors": result.get("errors", []),
-            }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        if isinstance(message_ids, str):
+            ids = [message_ids]
+        else:
+            ids = list(message_ids)
+
+        result = await client.restore_messages(ids)
+        return {
+            "restored": result.get("restored", 0),
+            "total": result.get("total", len(ids)),
+            "action": "restored_from_trash",
+            "errors": result.get("errors", []),
+        }
 
     @mcp.tool()
+    @_handle_tool_errors
     async def get_unread_count(
         account: str | None = None,
     ) -> dict[str, Any]:
@@ -623,27 +670,19 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
         Returns:
             Dict with unread message count.
         """
-        try:
-            account_id = None
-            if account:
-                accounts = await client.list_accounts()
-                try:
-                    resolved = resolve_account(account, accounts)
-                    account_id = resolved.id
-                except AccountResolutionError as e:
-                    return {"error": str(e), "available_accounts": e.available_accounts}
+        account_id = None
+        if account:
+            accounts = await client.list_accounts()
+            account_id = resolve_account(account, accounts).id
 
-            result = await client.get_unread_count(account_id)
-            return {
-                "unread_count": result.get("count", 0),
-                "account": account or "all",
-            }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        result = await client.get_unread_count(account_id)
+        return {
+            "unread_count": result.get("count", 0),
+            "account": account or "all",
+        }
 
     @mcp.tool()
+    @_handle_tool_errors
     async def list_tags() -> dict[str, Any]:
         """List all available tags with message counts.
 
@@ -653,13 +692,8 @@ def register_tools(mcp: FastMCP, client: AxiosMailClient) -> None:
         Returns:
             Dict with list of tags, each having name and count.
         """
-        try:
-            result = await client.list_tags()
-            return {
-                "tags": result.get("tags", []),
-                "total_tags": len(result.get("tags", [])),
-            }
-        except APIConnectionError as e:
-            return {"error": str(e)}
-        except APIError as e:
-            return {"error": str(e)}
+        result = await client.list_tags()
+        return {
+            "tags": result.get("tags", []),
+            "total_tags": len(result.get("tags", [])),
+        }
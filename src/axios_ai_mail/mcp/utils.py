@@ -4,6 +4,8 @@ This module provides helper functions for account resolution and
 other common operations needed by MCP tools.
 """
 
+from collections.abc import Sequence
+
 from .client import Account
 
 
@@ -17,7 +19,7 @@ class AccountResolutionError(Exception):
 
 def resolve_account(
     account_query: str | None,
-    accounts: list[Account],
+    accounts: Sequence[Account],
 ) -> Account:
     """Resolve a human-readable account name or ID to an Account.
 
@@ -29,7 +31,7 @@ def resolve_account(
 
     Args:
         account_query: Account name or ID, or None for default
-        accounts: List of available accounts
+        accounts: Available accounts
 
     Returns:
         Resolved Account object
@@ -1,13 +1,30 @@
 """Email provider abstraction layer."""
 
+import importlib
+from typing import Any
+
 from .base import EmailProvider, Message, Classification, ProviderConfig
 from .registry import ProviderRegistry
-from .implementations.gmail import GmailProvider
-from .implementations.imap import IMAPProvider
 
-# Register providers
-ProviderRegistry.register("gmail", GmailProvider)
-ProviderRegistry.register("imap", IMAPProvider)
+# Register providers lazily so their heavy dependencies (Google API client,
+# imaplib, ...) are only imported once a provider of that type is used
+ProviderRegistry.register_lazy("gmail", f"{__name__}.implementations.gmail:GmailProvider")
+ProviderRegistry.register_lazy("imap", f"{__name__}.implementations.imap:IMAPProvider")
+
+# Provider classes still importable from this package, loaded on first access
+_LAZY_EXPORTS = {
+    "GmailProvider": ".implementations.gmail",
+    "IMAPProvider": ".implementations.imap",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import provider implementations on first attribute access (PEP 562)."""
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "EmailProvider",
@@ -1,12 +1,25 @@
 """Base provider abstraction and data models."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Protocol, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Protocol, Set, Tuple
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _intern_labels(labels: FrozenSet[str]) -> FrozenSet[str]:
+    """Return a shared instance for equal label sets.
+
+    A sync cycle produces thousands of messages carrying the same handful of
+    label combinations, so they can all point at one frozenset. frozenset
+    doesn't support weak references, hence a bounded LRU cache instead of a
+    WeakValueDictionary.
+    """
+    return labels
+
+
+@dataclass(slots=True)
 class Message:
     """Normalized message representation across providers."""
 
@@ -19,30 +32,34 @@ class Message:
     snippet: str
     body_text: Optional[str] = None
     body_html: Optional[str] = None
-    labels: Set[str] = field(default_factory=set)
+    labels: FrozenSet[str] = frozenset()
     is_unread: bool = True
     folder: str = "inbox"
     imap_folder: Optional[str] = None  # Actual IMAP folder name (e.g., "INBOX.Sent")
     has_attachments: bool = False
 
     def __post_init__(self) -> None:
-        """Ensure labels is a set."""
-        if isinstance(self.labels, list):
-            self.labels = set(self.labels)
+        """Ensure labels is an interned frozenset."""
+        self.labels = _intern_labels(frozenset(self.labels))
 
 
-@dataclass
+@dataclass(slots=True)
 class Classification:
     """AI classification result."""
 
-    tags: List[str]
+    tags: Tuple[str, ...]
     priority: str  # "high" or "normal"
     todo: bool
     can_archive: bool
     confidence: Optional[float] = None
 
+    def __post_init__(self) -> None:
+        """Ensure tags is a tuple."""
+        if not isinstance(self.tags, tuple):
+            self.tags = tuple(self.tags)
+
 
-@dataclass
+@dataclass(slots=True)
 class ProviderConfig:
     """Base configuration for email providers."""
 
@@ -59,13 +76,18 @@ class EmailProvider(Protocol):
         ...
 
     def fetch_messages(
-        self, since: Optional[datetime] = None, max_results: int = 100
+        self,
+        since: Optional[datetime] = None,
+        max_results: int = 100,
+        known_ids: Optional[Set[str]] = None,
     ) -> List[Message]:
         """Fetch new/changed messages since last sync.
 
         Args:
             since: Only fetch messages newer than this timestamp
             max_results: Maximum number of messages to fetch
+            known_ids: IDs already stored and classified locally; providers
+                may skip downloading these again
 
         Returns:
             List of Message objects
@@ -254,7 +276,10 @@ class BaseEmailProvider(ABC):
 
     @abstractmethod
     def fetch_messages(
-        self, since: Optional[datetime] = None, max_results: int = 100
+        self,
+        since: Optional[datetime] = None,
+        max_results: int = 100,
+        known_ids: Optional[Set[str]] = None,
     ) -> List[Message]:
         """Fetch messages from provider."""
         pass
@@ -266,6 +291,22 @@ class BaseEmailProvider(ABC):
         """Update labels on a message."""
         pass
 
+    def batch_update_labels(
+        self, message_ids: List[str], add_labels: Set[str], remove_labels: Set[str]
+    ) -> None:
+        """Apply the same label changes to several messages.
+
+        Default implementation - updates each message in turn. Providers
+        with a bulk endpoint can override it.
+
+        Args:
+            message_ids: Provider-specific message IDs
+            add_labels: Label names to add
+            remove_labels: Label names to remove
+        """
+        for message_id in message_ids:
+            self.update_labels(message_id, add_labels, remove_labels)
+
     @abstractmethod
     def create_label(self, name: str, color: Optional[str] = None) -> str:
         """Create a label."""
@@ -422,12 +463,14 @@ class BaseEmailProvider(ABC):
             label_names: Set of label names to ensure exist
             colors: Optional mapping of label names to colors
         """
+        # The fresh listing doubles as the label cache so a following
+        # get_label_mapping() doesn't have to fetch it again
         existing_labels = self.list_labels()
+        self._label_cache = existing_labels
         colors = colors or {}
 
         for label_name in label_names:
             if label_name not in existing_labels:
                 color = colors.get(label_name)
-                self.create_label(label_name, color)
-                # Invalidate cache
-                self._label_cache = None
+                # Record the new label in place instead of invalidating the cache
+                existing_labels[label_name] = self.create_label(label_name, color)
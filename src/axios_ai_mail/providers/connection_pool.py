@@ -9,12 +9,21 @@ import asyncio
 import imaplib
 import logging
 import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Callable, Any
-from threading import Lock
+from typing import Deque, Dict, List, Optional, Callable, Any, Tuple
+from threading import Event, Lock, Thread
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent logouts when closing many connections at once
+MAX_CLOSE_WORKERS = 16
+
+# Upper bound on concurrent logins when pre-warming many accounts
+MAX_WARM_UP_WORKERS = 16
+
 
 @dataclass
 class PooledConnection:
@@ -24,21 +33,65 @@ class PooledConnection:
     account_id: str
     created_at: float = field(default_factory=time.time)
     last_used_at: float = field(default_factory=time.time)
-    in_use: bool = False
+    # Last time the connection was known to be working (NOOP or successful use)
+    last_verified_at: float = field(default_factory=time.time)
+    # Held while the connection is checked out; a non-blocking acquire is
+    # the compare-and-set that claims an idle connection
+    _gate: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    @property
+    def in_use(self) -> bool:
+        """Whether the connection is currently checked out."""
+        return self._gate.locked()
+
+    def try_acquire(self) -> bool:
+        """Claim the connection if it is idle, without blocking.
+
+        Returns:
+            True if the caller now owns the connection
+        """
+        return self._gate.acquire(blocking=False)
+
+    def release(self) -> None:
+        """Mark the connection as idle again."""
+        if self._gate.locked():
+            self._gate.release()
 
     def is_healthy(self) -> bool:
         """Check if the connection is still usable."""
         try:
             # NOOP is a lightweight command to check connection health
             status, _ = self.connection.noop()
-            return status == "OK"
+            if status != "OK":
+                return False
+            self.last_verified_at = time.time()
+            return True
         except Exception as e:
             logger.debug(f"Connection health check failed for {self.account_id}: {e}")
             return False
 
     def touch(self) -> None:
-        """Update last_used_at timestamp."""
-        self.last_used_at = time.time()
+        """Update last_used_at and last_verified_at timestamps."""
+        self.last_used_at = self.last_verified_at = time.time()
+
+
+def _on_event_loop_thread() -> bool:
+    """Whether the calling thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@dataclass(eq=False)
+class _Waiter:
+    """A caller blocked until a checked-out connection is handed to it."""
+
+    event: Event = field(default_factory=Event)
+    # Set by release_connection before the event fires; None means the
+    # pooled connection was closed and the waiter should create its own
+    connection: Optional[imaplib.IMAP4_SSL] = None
 
 
 class IMAPConnectionPool:
@@ -46,8 +99,12 @@ class IMAPConnectionPool:
 
     Features:
     - Connection reuse across sync cycles
-    - Automatic health checks before reuse
+    - Up to max_per_account pooled connections for concurrent callers
+    - LIFO reuse, and eviction of the least recently released idle
+      connection once max_total connections are pooled
+    - Health checks before reusing connections that haven't been verified recently
     - Idle timeout cleanup
+    - Background NOOP keep-alive so servers don't drop idle connections
     - Thread-safe connection management
 
     Usage:
@@ -62,10 +119,10 @@ class IMAPConnectionPool:
         # Use connection...
 
         # Release back to pool (keep alive)
-        pool.release_connection("my_account")
+        pool.release_connection("my_account", conn)
 
         # Or close specific connection
-        pool.close_connection("my_account")
+        pool.close_connection("my_account", conn)
 
         # Cleanup idle connections periodically
         pool.cleanup_idle_connections()
@@ -78,25 +135,62 @@ class IMAPConnectionPool:
         self,
         max_idle_seconds: int = 300,
         health_check_on_acquire: bool = True,
+        health_check_threshold: float = 60,
+        hand_off_timeout: float = 10,
+        keepalive_interval: Optional[float] = 300,
+        max_per_account: int = 2,
+        max_total: int = 100,
     ):
         """Initialize the connection pool.
 
         Args:
             max_idle_seconds: Close connections idle longer than this (default 5 min)
             health_check_on_acquire: Check connection health before returning (default True)
+            health_check_threshold: Only NOOP-check connections not verified within
+                this many seconds (default 60)
+            hand_off_timeout: How long to wait for a busy connection to be handed
+                over before opening an unpooled one (default 10s)
+            keepalive_interval: NOOP idle connections not verified within this many
+                seconds from a background thread (default 5 min, None disables)
+            max_per_account: Maximum pooled connections per account (default 2)
+            max_total: Maximum pooled connections across all accounts (default 100)
         """
-        self._connections: Dict[str, PooledConnection] = {}
-        self._locks: Dict[str, Lock] = {}
+        # Buckets are immutable tuples replaced under _global_lock, so they can
+        # be scanned without locking; claiming an idle connection goes through
+        # the per-connection gate instead. Accounts are ordered least recently
+        # released first, and so are the connections within a bucket.
+        self._connections: OrderedDict[str, Tuple[PooledConnection, ...]] = OrderedDict()
+        # Number of pooled connections across all buckets, guarded by _global_lock
+        self._total = 0
+        # Number of pooled connections checked out. Claims on the lock-free
+        # fast path update it too, so it has its own lock, always taken last.
+        self._in_use_count = 0
+        self._in_use_lock = Lock()
         self._global_lock = Lock()
         self._max_idle_seconds = max_idle_seconds
         self._health_check_on_acquire = health_check_on_acquire
-
-    def _get_lock(self, account_id: str) -> Lock:
-        """Get or create a lock for an account."""
-        with self._global_lock:
-            if account_id not in self._locks:
-                self._locks[account_id] = Lock()
-            return self._locks[account_id]
+        self._health_check_threshold = health_check_threshold
+        self._hand_off_timeout = hand_off_timeout
+        self._max_per_account = max_per_account
+        self._max_total = max_total
+        # Callers waiting for a busy connection, guarded by _global_lock
+        self._waiters: Dict[str, Deque[_Waiter]] = {}
+        # Per-account callbacks fired when a connection is dropped, guarded by
+        # _global_lock; each entry resolves to the callback or None once dead
+        self._invalidation_callbacks: Dict[
+            str, List[Callable[[], Optional[Callable[[str], None]]]]
+        ] = {}
+
+        self._keepalive_interval = keepalive_interval
+        self._keepalive_stop = Event()
+        self._keepalive_thread: Optional[Thread] = None
+        if keepalive_interval:
+            self._keepalive_thread = Thread(
+                target=self._keepalive_loop,
+                name="imap-pool-keepalive",
+                daemon=True,
+            )
+            self._keepalive_thread.start()
 
     def get_connection(
         self,
@@ -105,6 +199,13 @@ class IMAPConnectionPool:
     ) -> imaplib.IMAP4_SSL:
         """Get or create a connection for an account.
 
+        Reusing an idle connection takes no pool-wide lock: the account's
+        bucket is read with a plain dict lookup and a connection is claimed
+        through its gate, most recently released first. If the account
+        already has max_per_account busy connections, the caller waits for
+        one to be handed off; if none arrives in time, it gets an unpooled
+        connection that is logged out when released.
+
         Args:
             account_id: Unique identifier for the account
             create_fn: Function to create a new connection if needed
@@ -115,73 +216,319 @@ class IMAPConnectionPool:
         Raises:
             Exception: If connection creation fails
         """
-        lock = self._get_lock(account_id)
+        # Fast path: claim the warmest idle connection
+        for pooled in reversed(self._connections.get(account_id, ())):
+            if not self._claim(pooled):
+                continue
+            if self._needs_health_check(pooled) and not pooled.is_healthy():
+                logger.info(f"Connection for {account_id} unhealthy, replacing")
+                self._discard(pooled)
+                continue
+            # Reuse existing connection
+            logger.debug(f"Reusing pooled connection for {account_id}")
+            pooled.touch()
+            return pooled.connection
+
+        if len(self._connections.get(account_id, ())) >= self._max_per_account:
+            connection = self._wait_for_hand_off(account_id)
+            if connection is not None:
+                return connection
+
+        # Slow path: create new connection
+        logger.info(f"Creating new pooled connection for {account_id}")
+        try:
+            connection = create_fn()
+        except Exception as e:
+            logger.error(f"Failed to create connection for {account_id}: {e}")
+            raise
+
+        pooled = PooledConnection(connection=connection, account_id=account_id)
+        pooled.try_acquire()
+        if not self._add(pooled):
+            logger.warning(
+                f"All {self._max_per_account} connections for {account_id} in use, "
+                f"using an unpooled connection"
+            )
+        return connection
+
+    def _add(self, pooled: PooledConnection) -> bool:
+        """Add a connection to its account's bucket if there is room.
+
+        When the pool is at max_total, the least recently released idle
+        connection is evicted to make room.
+
+        Returns:
+            True if the connection was pooled
+        """
+        evicted = None
+        with self._global_lock:
+            bucket = self._connections.get(pooled.account_id, ())
+            if len(bucket) >= self._max_per_account:
+                return False
+            if self._total >= self._max_total:
+                evicted = self._evict_oldest_idle()
+                if evicted is None:
+                    return False
+                bucket = self._connections.get(pooled.account_id, ())
+            self._connections[pooled.account_id] = bucket + (pooled,)
+            self._connections.move_to_end(pooled.account_id)
+            self._total += 1
+            if pooled.in_use:
+                self._count_in_use(1)
+
+        if evicted is not None:
+            logger.info(f"Pool full, evicted idle connection for {evicted.account_id}")
+            self.invalidate_folder_cache(evicted.account_id)
+            self._close_connection_internal(evicted)
+        return True
+
+    def _evict_oldest_idle(self) -> Optional[PooledConnection]:
+        """Claim and detach the least recently released idle connection.
+
+        The caller holds _global_lock and closes the returned connection.
 
-        with lock:
-            pooled = self._connections.get(account_id)
+        Returns:
+            The evicted connection, or None if every connection is in use
+        """
+        for bucket in self._connections.values():
+            for pooled in bucket:
+                if self._claim(pooled):
+                    self._detach(pooled)
+                    return pooled
+        return None
 
-            # Check if we have a healthy existing connection
-            if pooled is not None:
-                if pooled.in_use:
-                    logger.warning(
-                        f"Connection for {account_id} already in use, creating new one"
-                    )
-                elif self._health_check_on_acquire and not pooled.is_healthy():
-                    logger.info(f"Connection for {account_id} unhealthy, replacing")
-                    self._close_connection_internal(pooled)
-                    pooled = None
-                else:
-                    # Reuse existing connection
-                    logger.debug(f"Reusing pooled connection for {account_id}")
-                    pooled.in_use = True
+    def _detach(self, pooled: PooledConnection) -> bool:
+        """Remove a connection from its bucket (caller holds _global_lock).
+
+        Returns:
+            True if the connection was pooled
+        """
+        bucket = self._connections.get(pooled.account_id, ())
+        if pooled not in bucket:
+            return False
+        remaining = tuple(p for p in bucket if p is not pooled)
+        if remaining:
+            self._connections[pooled.account_id] = remaining
+        else:
+            del self._connections[pooled.account_id]
+        self._total -= 1
+        if pooled.in_use:
+            self._count_in_use(-1)
+        # Room for a new connection now; let waiters open their own
+        for waiter in self._waiters.pop(pooled.account_id, ()):
+            waiter.event.set()
+        return True
+
+    def _claim(self, pooled: PooledConnection) -> bool:
+        """Claim a pooled connection through its gate, counting it as in use.
+
+        Returns:
+            True if the caller now owns the connection
+        """
+        if not pooled.try_acquire():
+            return False
+        self._count_in_use(1)
+        return True
+
+    def _count_in_use(self, delta: int) -> None:
+        """Adjust the checked-out connection count."""
+        with self._in_use_lock:
+            self._in_use_count += delta
+
+    def _discard(self, pooled: PooledConnection) -> None:
+        """Remove a broken connection from the pool and close it."""
+        with self._global_lock:
+            self._detach(pooled)
+        self.invalidate_folder_cache(pooled.account_id)
+        self._close_connection_internal(pooled)
+
+    def _find(
+        self, account_id: str, connection: imaplib.IMAP4_SSL
+    ) -> Optional[PooledConnection]:
+        """Find the pool entry for a connection.
+
+        Args:
+            account_id: Account the connection belongs to
+            connection: Connection to look up
+
+        Returns:
+            The matching pool entry, or None if the connection isn't pooled
+        """
+        for pooled in self._connections.get(account_id, ()):
+            if pooled.connection is connection:
+                return pooled
+        return None
+
+    def _wait_for_hand_off(self, account_id: str) -> Optional[imaplib.IMAP4_SSL]:
+        """Wait for a busy connection to be released directly to this caller.
+
+        Args:
+            account_id: Account whose connections are all busy
+
+        Returns:
+            The handed-off connection, or None if none arrived in time
+        """
+        waiter = _Waiter()
+        with self._global_lock:
+            # Released between the fast path and taking the lock
+            for pooled in self._connections.get(account_id, ()):
+                if self._claim(pooled):
                     pooled.touch()
                     return pooled.connection
+            if len(self._connections.get(account_id, ())) < self._max_per_account:
+                return None
+            if _on_event_loop_thread():
+                # Blocking here would stall every coroutine on the event loop;
+                # async callers should go through AsyncIMAPConnectionPool
+                return None
+            self._waiters.setdefault(account_id, deque()).append(waiter)
+
+        if not waiter.event.wait(self._hand_off_timeout):
+            with self._global_lock:
+                waiters = self._waiters.get(account_id)
+                if waiters is not None and waiter in waiters:
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del self._waiters[account_id]
+                    return None
+        # Handed off (possibly just as the wait timed out)
+        return waiter.connection
+
+    def _needs_health_check(self, pooled: PooledConnection) -> bool:
+        """Whether a connection has gone unverified long enough to NOOP it."""
+        if not self._health_check_on_acquire:
+            return False
+        return time.time() - pooled.last_verified_at > self._health_check_threshold
 
-            # Create new connection
-            logger.info(f"Creating new pooled connection for {account_id}")
-            try:
-                connection = create_fn()
-                pooled = PooledConnection(
-                    connection=connection,
-                    account_id=account_id,
-                    in_use=True,
-                )
-                self._connections[account_id] = pooled
-                return connection
-            except Exception as e:
-                logger.error(f"Failed to create connection for {account_id}: {e}")
-                raise
+    def warm_up(
+        self,
+        specs: List[Tuple[str, Callable[[], imaplib.IMAP4_SSL]]],
+    ) -> int:
+        """Open connections for several accounts ahead of the first sync.
+
+        Connections are created concurrently and each one is pinged with a
+        NOOP so the TLS handshake and LOGIN round-trips are complete before
+        the connection is added to the pool as idle. Accounts that already
+        have a pooled connection are skipped.
 
-    def release_connection(self, account_id: str) -> None:
+        Args:
+            specs: (account_id, create_fn) pairs to connect
+
+        Returns:
+            Number of connections added to the pool
+        """
+        specs = [
+            (account_id, create_fn)
+            for account_id, create_fn in specs
+            if account_id not in self._connections
+        ]
+        if not specs:
+            return 0
+
+        def _open(
+            account_id: str, create_fn: Callable[[], imaplib.IMAP4_SSL]
+        ) -> imaplib.IMAP4_SSL:
+            connection = create_fn()
+            connection.noop()
+            return connection
+
+        warmed = 0
+        with ThreadPoolExecutor(
+            max_workers=min(len(specs), MAX_WARM_UP_WORKERS),
+            thread_name_prefix="imap-warm-up",
+        ) as executor:
+            futures = [
+                (account_id, executor.submit(_open, account_id, create_fn))
+                for account_id, create_fn in specs
+            ]
+            for account_id, future in futures:
+                try:
+                    connection = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to pre-warm connection for {account_id}: {e}")
+                    continue
+
+                pooled = PooledConnection(connection=connection, account_id=account_id)
+                if self._add(pooled):
+                    warmed += 1
+                else:
+                    # Sync cycles filled the account's slots meanwhile
+                    self._close_connection_internal(pooled)
+
+        logger.info(f"Pre-warmed {warmed} of {len(specs)} IMAP connection(s)")
+        return warmed
+
+    def release_connection(
+        self, account_id: str, connection: imaplib.IMAP4_SSL
+    ) -> None:
         """Release a connection back to the pool (keep alive).
 
+        Unpooled connections handed out when the account was at its limit
+        are logged out instead.
+
         Args:
             account_id: Account whose connection to release
+            connection: The connection being released
         """
-        lock = self._get_lock(account_id)
-
-        with lock:
-            pooled = self._connections.get(account_id)
-            if pooled:
-                pooled.in_use = False
-                pooled.touch()
-                logger.debug(f"Released connection for {account_id} back to pool")
-            else:
-                logger.warning(f"No connection to release for {account_id}")
-
-    def close_connection(self, account_id: str) -> None:
+        pooled = self._find(account_id, connection)
+        if pooled is None:
+            logger.debug(f"Closing unpooled connection for {account_id}")
+            self._close_connection_internal(
+                PooledConnection(connection=connection, account_id=account_id)
+            )
+            return
+
+        pooled.touch()
+        self._check_in(pooled)
+
+    def _check_in(self, pooled: PooledConnection) -> None:
+        """Return a claimed connection, handing it to a waiter if one is queued."""
+        account_id = pooled.account_id
+        with self._global_lock:
+            waiters = self._waiters.get(account_id)
+            if waiters:
+                # Transfer ownership without marking the connection idle
+                waiter = waiters.popleft()
+                if not waiters:
+                    del self._waiters[account_id]
+                waiter.connection = pooled.connection
+                waiter.event.set()
+                logger.debug(f"Handed off connection for {account_id} to waiting caller")
+                return
+            # Most recently released goes last, so it is reused first and the
+            # coldest connections are the ones cleanup and eviction reach first
+            bucket = self._connections.get(account_id, ())
+            if pooled in bucket:
+                if bucket[-1] is not pooled:
+                    self._connections[account_id] = tuple(
+                        p for p in bucket if p is not pooled
+                    ) + (pooled,)
+                self._connections.move_to_end(account_id)
+                self._count_in_use(-1)
+            pooled.release()
+        logger.debug(f"Released connection for {account_id} back to pool")
+
+    def close_connection(
+        self, account_id: str, connection: imaplib.IMAP4_SSL
+    ) -> None:
         """Close and remove a specific connection.
 
         Args:
             account_id: Account whose connection to close
+            connection: The connection to close
         """
-        lock = self._get_lock(account_id)
+        with self._global_lock:
+            pooled = self._find(account_id, connection)
+            was_pooled = pooled is not None
+            if pooled is None:
+                pooled = PooledConnection(connection=connection, account_id=account_id)
+            else:
+                self._detach(pooled)
 
-        with lock:
-            pooled = self._connections.pop(account_id, None)
-            if pooled:
-                self._close_connection_internal(pooled)
-                logger.info(f"Closed connection for {account_id}")
+        if was_pooled:
+            self.invalidate_folder_cache(account_id)
+        self._close_connection_internal(pooled)
+        logger.info(f"Closed connection for {account_id}")
 
     def _close_connection_internal(self, pooled: PooledConnection) -> None:
         """Close a connection (internal, no locking)."""
@@ -194,26 +541,88 @@ class IMAPConnectionPool:
         except Exception:
             pass
 
+    def _keepalive_loop(self) -> None:
+        """Periodically NOOP idle connections until the pool is closed."""
+        while not self._keepalive_stop.wait(self._keepalive_interval):
+            try:
+                self.send_keepalives()
+            except Exception as e:
+                logger.warning(f"IMAP keep-alive pass failed: {e}")
+
+    def send_keepalives(self) -> int:
+        """NOOP idle connections that haven't been verified recently.
+
+        Connections that fail the NOOP are closed so the next sync cycle
+        reconnects up front rather than discovering the dead socket mid-use.
+        Pinging only refreshes last_verified_at, so idle cleanup still applies.
+
+        Returns:
+            Number of connections pinged
+        """
+        if self._keepalive_interval is None:
+            return 0
+
+        now = time.time()
+        pinged = 0
+        for bucket in list(self._connections.values()):
+            for pooled in bucket:
+                if now - pooled.last_verified_at < self._keepalive_interval:
+                    continue
+                # Claim the connection so a sync cycle can't use it mid-NOOP
+                if not self._claim(pooled):
+                    continue
+                pinged += 1
+                if pooled.is_healthy():
+                    self._check_in(pooled)
+                else:
+                    logger.info(
+                        f"Keep-alive failed for {pooled.account_id}, closing connection"
+                    )
+                    self._discard(pooled)
+        return pinged
+
+    def _close_connections(self, pooled_connections: List[PooledConnection]) -> None:
+        """Close several removed connections, logging out of each concurrently.
+
+        Args:
+            pooled_connections: Connections already removed from the pool
+        """
+        if len(pooled_connections) <= 1:
+            for pooled in pooled_connections:
+                self._close_connection_internal(pooled)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(pooled_connections), MAX_CLOSE_WORKERS),
+            thread_name_prefix="imap-close",
+        ) as executor:
+            list(executor.map(self._close_connection_internal, pooled_connections))
+
     def cleanup_idle_connections(self) -> int:
         """Close connections that have been idle too long.
 
+        Connections are visited least recently released first.
+
         Returns:
             Number of connections closed
         """
         now = time.time()
-        closed = 0
 
         with self._global_lock:
-            accounts_to_close = []
-            for account_id, pooled in self._connections.items():
-                if not pooled.in_use:
-                    idle_time = now - pooled.last_used_at
-                    if idle_time > self._max_idle_seconds:
-                        accounts_to_close.append(account_id)
-
-        for account_id in accounts_to_close:
-            self.close_connection(account_id)
-            closed += 1
+            to_close = []
+            for bucket in list(self._connections.values()):
+                for pooled in bucket:
+                    if now - pooled.last_used_at <= self._max_idle_seconds:
+                        continue
+                    # Claiming it keeps a sync cycle from taking it mid-close
+                    if self._claim(pooled):
+                        self._detach(pooled)
+                        to_close.append(pooled)
+
+        for account_id in {pooled.account_id for pooled in to_close}:
+            self.invalidate_folder_cache(account_id)
+        self._close_connections(to_close)
+        closed = len(to_close)
 
         if closed > 0:
             logger.info(f"Cleaned up {closed} idle connection(s)")
@@ -222,13 +631,24 @@ class IMAPConnectionPool:
 
     def close_all(self) -> None:
         """Close all connections (for shutdown)."""
+        self._keepalive_stop.set()
         with self._global_lock:
-            account_ids = list(self._connections.keys())
-
-        for account_id in account_ids:
-            self.close_connection(account_id)
-
-        logger.info(f"Closed all {len(account_ids)} connection(s)")
+            to_close = [p for bucket in self._connections.values() for p in bucket]
+            for pooled in to_close:
+                # Keeps the fast path from claiming it after the clear
+                pooled.try_acquire()
+            self._connections.clear()
+            self._total = 0
+            with self._in_use_lock:
+                self._in_use_count = 0
+            for waiters in self._waiters.values():
+                for waiter in waiters:
+                    waiter.event.set()
+            self._waiters.clear()
+
+        self._close_connections(to_close)
+
+        logger.info(f"Closed all {len(to_close)} connection(s)")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get pool statistics.
@@ -237,28 +657,145 @@ class IMAPConnectionPool:
             Dictionary with pool stats
         """
         with self._global_lock:
-            total = len(self._connections)
-            in_use = sum(1 for p in self._connections.values() if p.in_use)
-            idle = total - in_use
+            total = self._total
+            in_use = self._in_use_count
+            accounts = list(self._connections)
+
+        return {
+            "total_connections": total,
+            "in_use": in_use,
+            "idle": total - in_use,
+            "accounts": accounts,
+        }
 
-            return {
-                "total_connections": total,
-                "in_use": in_use,
-                "idle": idle,
-                "accounts": list(self._connections.keys()),
-            }
+    def register_invalidation_callback(
+        self, account_id: str, callback: Callable[[str], None]
+    ) -> None:
+        """Register a callback to run when an account's connection is dropped.
+
+        Bound methods are held weakly, so registering a provider's cache
+        clearer doesn't keep the provider alive after its sync cycle.
+
+        Args:
+            account_id: Account to watch
+            callback: Called with the account_id on invalidation
+        """
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            ref: Callable[[], Optional[Callable[[str], None]]] = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback  # noqa: E731
+
+        with self._global_lock:
+            callbacks = self._invalidation_callbacks.setdefault(account_id, [])
+            callbacks[:] = [r for r in callbacks if r() is not None]
+            callbacks.append(ref)
 
     def invalidate_folder_cache(self, account_id: str) -> None:
         """Invalidate folder cache for an account.
 
-        Called when connection is reset and folders may have changed.
+        Called when a connection is closed or fails its health check, since
+        the next connection starts with no folder selected and folders may
+        have changed. Runs every live callback registered for the account.
 
         Args:
             account_id: Account whose folder cache to invalidate
         """
-        # This will be used by IMAPProvider to clear its folder mapping cache
-        # when the connection pool detects a connection reset
-        pass
+        with self._global_lock:
+            refs = self._invalidation_callbacks.get(account_id)
+            if not refs:
+                return
+            callbacks = [cb for cb in (r() for r in refs) if cb is not None]
+            if len(callbacks) < len(refs):
+                refs[:] = [r for r in refs if r() is not None]
+                if not refs:
+                    del self._invalidation_callbacks[account_id]
+
+        for callback in callbacks:
+            try:
+                callback(account_id)
+            except Exception as e:
+                logger.warning(f"Folder cache invalidation failed for {account_id}: {e}")
+
+
+class AsyncIMAPConnectionPool:
+    """Asyncio front end to an IMAPConnectionPool.
+
+    imaplib is blocking, so connection creation, health checks, hand-off
+    waits and logouts run in worker threads via asyncio.to_thread and the
+    event loop is never parked. Connections are shared with the wrapped
+    thread-based pool, so async and threaded callers reuse the same ones,
+    and the per-account limit and hand-off queue of that pool apply.
+    """
+
+    def __init__(self, pool: Optional[IMAPConnectionPool] = None):
+        """Initialize the async pool.
+
+        Args:
+            pool: Pool to wrap (default: the global connection pool)
+        """
+        self._pool = pool or get_connection_pool()
+
+    async def get_connection(
+        self,
+        account_id: str,
+        create_fn: Callable[[], imaplib.IMAP4_SSL],
+    ) -> imaplib.IMAP4_SSL:
+        """Get or create a connection for an account without blocking the loop.
+
+        Args:
+            account_id: Unique identifier for the account
+            create_fn: Function to create a new connection if needed
+
+        Returns:
+            IMAP connection (either existing or newly created)
+        """
+        return await asyncio.to_thread(self._pool.get_connection, account_id, create_fn)
+
+    def release_connection(
+        self, account_id: str, connection: imaplib.IMAP4_SSL
+    ) -> None:
+        """Release a connection back to the pool (never blocks on I/O).
+
+        Args:
+            account_id: Account whose connection to release
+            connection: The connection being released
+        """
+        if self._pool._find(account_id, connection) is not None:
+            self._pool.release_connection(account_id, connection)
+            return
+        # Releasing an unpooled connection logs it out, so keep it off the loop
+        asyncio.get_running_loop().run_in_executor(
+            None, self._pool.release_connection, account_id, connection
+        )
+
+    async def close_connection(
+        self, account_id: str, connection: imaplib.IMAP4_SSL
+    ) -> None:
+        """Close and remove a specific connection.
+
+        Args:
+            account_id: Account whose connection to close
+            connection: The connection to close
+        """
+        await asyncio.to_thread(self._pool.close_connection, account_id, connection)
+
+    async def warm_up(
+        self,
+        specs: List[Tuple[str, Callable[[], imaplib.IMAP4_SSL]]],
+    ) -> int:
+        """Open connections for several accounts ahead of the first sync.
+
+        Args:
+            specs: (account_id, create_fn) pairs to connect
+
+        Returns:
+            Number of connections added to the pool
+        """
+        return await asyncio.to_thread(self._pool.warm_up, specs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics of the wrapped pool."""
+        return self._pool.get_stats()
 
 
 # Global connection pool instance
@@ -4,7 +4,6 @@ import logging
 from typing import TYPE_CHECKING
 
 from .base import BaseEmailProvider
-from .implementations.gmail import GmailConfig, GmailProvider
 from .registry import ProviderRegistry
 
 if TYPE_CHECKING:
@@ -31,6 +30,9 @@ class ProviderFactory:
             ValueError: If provider type is not supported
         """
         if account.provider == "gmail":
+            # Import lazily so IMAP-only deployments never load the Google API client
+            from .implementations.gmail import GmailConfig
+
             config = GmailConfig(
                 account_id=account.id,
                 email=account.email,
@@ -53,6 +55,8 @@ class ProviderFactory:
                 port=account.settings.get("imap_port", 993),
                 use_ssl=account.settings.get("imap_tls", True),
                 folder=account.settings.get("imap_folder", "INBOX"),
+                fetch_batch_size=account.settings.get("imap_fetch_batch_size", 50),
+                folder_fetch_connections=account.settings.get("imap_fetch_connections", 2),
                 # SMTP settings for sending
                 smtp_host=account.settings.get("smtp_host"),
                 smtp_port=account.settings.get("smtp_port", 587),
@@ -7,7 +7,11 @@ when new mail arrives, instead of polling.
 import asyncio
 import imaplib
 import logging
-import select
+import os
+import re
+import selectors
+import socket
+import ssl
 import threading
 import time
 from dataclasses import dataclass
@@ -32,6 +36,50 @@ class IdleConfig:
     folder: str = "INBOX"
 
 
+class _WakePipe:
+    """Self-pipe that wakes a selector from another thread.
+
+    The watcher thread that registered the read end closes the pipe when it
+    exits; wake() is a no-op afterwards, so a stopping thread never writes
+    to a closed (or reused) file descriptor.
+    """
+
+    def __init__(self) -> None:
+        self.read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+        os.set_blocking(self._write_fd, False)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def wake(self) -> None:
+        """Make the read end readable."""
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                os.write(self._write_fd, b"x")
+            except BlockingIOError:
+                # Pipe already full of wake-ups
+                pass
+
+    def drain(self) -> None:
+        """Discard pending wake-ups so the read end stops selecting readable."""
+        try:
+            while os.read(self.read_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        """Close both ends (idempotent)."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            os.close(self.read_fd)
+            os.close(self._write_fd)
+
+
 class IMAPIdleConnection:
     """Manages a single IMAP IDLE connection for one account."""
 
@@ -42,6 +90,16 @@ class IMAPIdleConnection:
     # Reconnect delay in seconds after disconnection
     RECONNECT_DELAY = 30
 
+    # Safety bound on untagged lines read while waiting for IDLE to complete
+    MAX_EXIT_LINES = 100
+
+    # Untagged mailbox-size/flag updates pushed during IDLE (e.g. "* 5 EXISTS")
+    _IDLE_RE = re.compile(rb"\*\s+\d+\s+(EXISTS|EXPUNGE|RECENT|FETCH)\b")
+
+    # Whether each "host:port" supports IDLE, shared across connections so
+    # reconnects skip the CAPABILITY round-trip
+    _capability_cache: Dict[str, bool] = {}
+
     def __init__(
         self,
         config: IdleConfig,
@@ -60,6 +118,9 @@ class IMAPIdleConnection:
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._idle_tag: Optional[bytes] = None
+        self._exists_during_exit = False
+        # Self-pipe: stop() writes a byte so the selector wakes immediately
+        self._wake_pipe: Optional[_WakePipe] = None
 
     def _connect(self) -> bool:
         """Establish IMAP connection and enter IDLE mode.
@@ -91,14 +152,11 @@ class IMAPIdleConnection:
                 return False
 
             # Check IDLE capability
-            typ, capabilities = self._connection.capability()
-            if typ == "OK":
-                cap_str = capabilities[0].decode("utf-8", errors="ignore")
-                if "IDLE" not in cap_str:
-                    logger.warning(
-                        f"IMAP server for {self.config.account_id} doesn't support IDLE"
-                    )
-                    return False
+            if not self._supports_idle():
+                logger.warning(
+                    f"IMAP server for {self.config.account_id} doesn't support IDLE"
+                )
+                return False
 
             logger.info(
                 f"IMAP IDLE connected for {self.config.account_id} "
@@ -111,6 +169,23 @@ class IMAPIdleConnection:
             self._connection = None
             return False
 
+    def _supports_idle(self) -> bool:
+        """Check whether the server supports IDLE, using the per-host cache.
+
+        Returns:
+            False only if the server's capabilities omit IDLE
+        """
+        key = f"{self.config.host}:{self.config.port}"
+        has_idle = self._capability_cache.get(key)
+        if has_idle is None:
+            typ, capabilities = self._connection.capability()
+            if typ != "OK":
+                # Unknown; try IDLE anyway and re-check on the next connect
+                return True
+            has_idle = b"IDLE" in capabilities[0]
+            self._capability_cache[key] = has_idle
+        return has_idle
+
     def _enter_idle(self) -> bool:
         """Send IDLE command to server.
 
@@ -154,6 +229,10 @@ class IMAPIdleConnection:
     def _exit_idle(self) -> bool:
         """Send DONE to exit IDLE mode.
 
+        Untagged responses the server sends before completing the IDLE
+        command are consumed; an EXISTS among them sets
+        _exists_during_exit so the caller can still report the new mail.
+
         Returns:
             True if successful, False otherwise
         """
@@ -164,9 +243,16 @@ class IMAPIdleConnection:
             # Send DONE to exit IDLE
             self._connection.send(b"DONE\r\n")
 
-            # Read response (should be OK)
-            response = self._connection.readline()
-            logger.debug(f"IDLE exit response for {self.config.account_id}: {response}")
+            # Read until the tagged completion of the IDLE command
+            for _ in range(self.MAX_EXIT_LINES):
+                response = self._connection.readline()
+                if not response:
+                    raise ConnectionError("IMAP server closed the connection")
+                logger.debug(f"IDLE exit response for {self.config.account_id}: {response}")
+                if not response.startswith(b"*"):
+                    break
+                if self._push_event(response) == b"EXISTS":
+                    self._exists_during_exit = True
 
             self._idle_tag = None
             return True
@@ -175,8 +261,85 @@ class IMAPIdleConnection:
             logger.error(f"Failed to exit IDLE for {self.config.account_id}: {e}")
             return False
 
-    def _watch_loop(self):
-        """Main IDLE watching loop (runs in separate thread)."""
+    def _push_event(self, response: bytes) -> Optional[bytes]:
+        """Classify an untagged IDLE push (EXISTS, EXPUNGE, RECENT or FETCH)."""
+        match = self._IDLE_RE.match(response)
+        return match.group(1) if match else None
+
+    def _has_buffered_response(self) -> bool:
+        """Check whether more server output is already buffered client-side.
+
+        imaplib reads through a buffered file object (and TLS has its own
+        record buffer), so several pushed lines can be pulled in by one
+        read while the socket itself never selects readable again.
+
+        Returns:
+            True if readline() would return without waiting on the network
+        """
+        sock = self._connection.socket()
+        timeout = sock.gettimeout()
+        sock.settimeout(0)
+        try:
+            return bool(self._connection.file.peek(1))
+        except (BlockingIOError, ssl.SSLWantReadError):
+            return False
+        finally:
+            sock.settimeout(timeout)
+
+    def _read_pushes(self) -> bool:
+        """Read every server push that is available without blocking.
+
+        Returns:
+            True if any of them announced new mail (EXISTS)
+
+        Raises:
+            ConnectionError: If the server closed the connection
+        """
+        new_mail = False
+        while True:
+            response = self._connection.readline()
+            if not response:
+                raise ConnectionError("IMAP server closed the connection")
+            logger.debug(f"IDLE response for {self.config.account_id}: {response}")
+
+            event = self._push_event(response)
+            if event == b"EXISTS":
+                new_mail = True
+            elif event == b"EXPUNGE":
+                logger.debug(f"Message expunged for {self.config.account_id}")
+            # Other untagged responses are consumed without leaving IDLE
+
+            if not self._has_buffered_response():
+                return new_mail
+
+    def _notify_new_mail(self):
+        """Invoke the new-mail callback, logging any error it raises."""
+        logger.info(f"New mail detected for {self.config.account_id}")
+        try:
+            self.on_new_mail(self.config.account_id)
+        except Exception as e:
+            logger.error(f"Callback error: {e}")
+
+    def _watch_loop(self, wake_pipe: _WakePipe):
+        """Main IDLE watching loop (runs in separate thread).
+
+        Args:
+            wake_pipe: Pipe that stop() uses to wake this thread; closed here
+                on exit, after the selector no longer references it
+        """
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(wake_pipe.read_fd, selectors.EVENT_READ)
+                self._run_sessions(selector)
+        finally:
+            wake_pipe.close()
+
+    def _run_sessions(self, selector: selectors.BaseSelector):
+        """Connect, IDLE until disconnected, and reconnect until stopped.
+
+        Args:
+            selector: Selector with the wake pipe registered
+        """
         while self._running and not self._stop_event.is_set():
             # Try to connect
             if not self._connect():
@@ -187,62 +350,43 @@ class IMAPIdleConnection:
                 self._stop_event.wait(self.RECONNECT_DELAY)
                 continue
 
-            # Main IDLE loop
+            # Main IDLE loop: stay in IDLE until new mail, refresh or stop
+            sock = self._connection.socket()
+            selector.register(sock, selectors.EVENT_READ)
             idle_start = time.time()
             while self._running and not self._stop_event.is_set():
-                # Enter IDLE mode
-                if not self._enter_idle():
-                    break
+                # (Re-)enter IDLE mode if we left it
+                if self._idle_tag is None:
+                    if not self._enter_idle():
+                        break
+                    idle_start = time.time()
 
                 try:
-                    # Wait for server response using select with timeout
-                    # Use shorter timeout for responsiveness to stop_event
-                    sock = self._connection.socket()
-                    readable, _, _ = select.select([sock], [], [], 30)
-
-                    if readable:
-                        # Read response from server
-                        response = self._connection.readline()
-                        logger.debug(
-                            f"IDLE response for {self.config.account_id}: {response}"
-                        )
-
-                        # Check for EXISTS (new mail)
-                        if b"EXISTS" in response:
-                            logger.info(
-                                f"New mail detected for {self.config.account_id}"
-                            )
-                            # Exit IDLE before callback
-                            self._exit_idle()
-                            # Notify callback
-                            try:
-                                self.on_new_mail(self.config.account_id)
-                            except Exception as e:
-                                logger.error(f"Callback error: {e}")
-                            # Re-enter IDLE loop
-                            idle_start = time.time()
-                            continue
-
-                        # Check for EXPUNGE (message deleted)
-                        if b"EXPUNGE" in response:
-                            logger.debug(f"Message expunged for {self.config.account_id}")
-                            # Exit IDLE and continue
-                            self._exit_idle()
-                            idle_start = time.time()
-                            continue
-
                     # Exit IDLE periodically to refresh (per RFC recommendation)
-                    if time.time() - idle_start > self.IDLE_TIMEOUT:
+                    remaining = self.IDLE_TIMEOUT - (time.time() - idle_start)
+                    if remaining <= 0:
                         logger.debug(
                             f"IDLE timeout refresh for {self.config.account_id}"
                         )
-                        self._exit_idle()
-                        idle_start = time.time()
+                        self._exists_during_exit = False
+                        if not self._exit_idle():
+                            break
+                        if self._exists_during_exit:
+                            self._notify_new_mail()
                         # NOOP to keep connection alive
                         self._connection.noop()
-                    else:
-                        # No data, exit IDLE and re-enter
-                        self._exit_idle()
+                        continue
+
+                    # Wait for a server push, refresh deadline or stop()
+                    events = selector.select(timeout=min(remaining, 60))
+                    if not any(key.fileobj is sock for key, _ in events):
+                        continue
+
+                    if self._read_pushes():
+                        # Exit IDLE before callback
+                        if not self._exit_idle():
+                            break
+                        self._notify_new_mail()
 
                 except (OSError, ConnectionError, imaplib.IMAP4.error) as e:
                     logger.warning(f"IDLE connection error: {e}")
@@ -252,12 +396,16 @@ class IMAPIdleConnection:
                     break
 
             # Cleanup connection
+            selector.unregister(sock)
             if self._connection:
                 try:
+                    if self._idle_tag:
+                        self._exit_idle()
                     self._connection.logout()
                 except Exception:
                     pass
                 self._connection = None
+            self._idle_tag = None
 
             # Wait before reconnecting (if still running)
             if self._running and not self._stop_event.is_set():
@@ -274,8 +422,10 @@ class IMAPIdleConnection:
 
         self._running = True
         self._stop_event.clear()
+        self._wake_pipe = _WakePipe()
         self._thread = threading.Thread(
             target=self._watch_loop,
+            args=(self._wake_pipe,),
             name=f"imap-idle-{self.config.account_id}",
             daemon=True,
         )
@@ -290,27 +440,264 @@ class IMAPIdleConnection:
         self._running = False
         self._stop_event.set()
 
-        # Try to wake up the select by closing socket
-        if self._connection:
-            try:
-                # Exit IDLE first if in IDLE mode
-                if self._idle_tag:
-                    self._exit_idle()
-                self._connection.logout()
-            except Exception:
-                pass
-            self._connection = None
+        # Wake the selector; the watcher thread exits IDLE and logs out itself
+        if self._wake_pipe:
+            self._wake_pipe.wake()
+            self._wake_pipe = None
 
         # Wait for thread to finish
         if self._thread:
             self._thread.join(timeout=5)
+            connection = self._connection
+            if self._thread.is_alive() and connection:
+                # Stuck in a blocking read. Shutting the socket down unblocks
+                # it without closing the fd under the watcher thread, which
+                # then cleans up the connection itself.
+                try:
+                    connection.socket().shutdown(socket.SHUT_RDWR)
+                except Exception:
+                    pass
             self._thread = None
 
         logger.info(f"Stopped IMAP IDLE watcher for {self.config.account_id}")
 
 
+@dataclass(eq=False)
+class _IdleSession:
+    """Per-account state for MultiplexedIdleRunner, attached as selector key data.
+
+    The IDLE tag and new-mail callback live on the wrapped connection.
+    """
+
+    idle: IMAPIdleConnection
+    sock: Optional[socket.socket] = None
+    idle_start: float = 0.0
+    retry_at: float = 0.0
+
+
+class MultiplexedIdleRunner:
+    """Watches IDLE connections for many accounts from a single thread.
+
+    Every IDLE socket is registered with one selector, so watching N
+    accounts costs one thread instead of N. Connecting, refreshing and
+    dispatching pushes all happen on that thread, so new-mail callbacks
+    must return quickly (e.g. by scheduling work on an event loop).
+    """
+
+    # Upper bound on a single select() so added accounts are picked up
+    # even if a wake-up were lost
+    MAX_SELECT_TIMEOUT = 60.0
+
+    def __init__(self) -> None:
+        """Initialize the runner (call start() to begin watching)."""
+        self._lock = threading.Lock()
+        # Accounts to watch and sessions awaiting disconnect, guarded by _lock
+        self._sessions: Dict[str, _IdleSession] = {}
+        self._removed: List[_IdleSession] = []
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._wake_pipe: Optional[_WakePipe] = None
+
+    def add_account(self, connection: IMAPIdleConnection) -> None:
+        """Start watching an account (no-op if already watched).
+
+        Args:
+            connection: Unstarted IDLE connection for the account
+        """
+        account_id = connection.config.account_id
+        with self._lock:
+            if account_id in self._sessions:
+                return
+            self._sessions[account_id] = _IdleSession(idle=connection)
+            wake_pipe = self._wake_pipe
+        if wake_pipe:
+            wake_pipe.wake()
+
+    def remove_account(self, account_id: str) -> None:
+        """Stop watching an account; its connection is closed by the runner.
+
+        Args:
+            account_id: Account ID to remove
+        """
+        with self._lock:
+            session = self._sessions.pop(account_id, None)
+            if session is None:
+                return
+            self._removed.append(session)
+            wake_pipe = self._wake_pipe
+        if wake_pipe:
+            wake_pipe.wake()
+
+    def start(self) -> None:
+        """Start the runner thread."""
+        if self._thread:
+            return
+
+        self._stop_event.clear()
+        with self._lock:
+            self._wake_pipe = _WakePipe()
+            wake_pipe = self._wake_pipe
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(wake_pipe,),
+            name="imap-idle-runner",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info("Started multiplexed IMAP IDLE runner")
+
+    def stop(self) -> None:
+        """Stop the runner thread, logging out of every account."""
+        if not self._thread:
+            return
+
+        self._stop_event.set()
+        with self._lock:
+            wake_pipe, self._wake_pipe = self._wake_pipe, None
+        if wake_pipe:
+            wake_pipe.wake()
+
+        self._thread.join(timeout=5)
+        if self._thread.is_alive():
+            # Stuck in a blocking read; unblock it the same way as
+            # IMAPIdleConnection.stop() and let the thread clean up
+            with self._lock:
+                sessions = list(self._sessions.values())
+            for session in sessions:
+                if session.sock:
+                    try:
+                        session.sock.shutdown(socket.SHUT_RDWR)
+                    except Exception:
+                        pass
+        self._thread = None
+        logger.info("Stopped multiplexed IMAP IDLE runner")
+
+    def _run(self, wake_pipe: _WakePipe) -> None:
+        """Runner thread: service every account until stopped.
+
+        Args:
+            wake_pipe: Pipe used to wake the selector; closed here on exit
+        """
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(wake_pipe.read_fd, selectors.EVENT_READ, None)
+                while not self._stop_event.is_set():
+                    self._service(selector, wake_pipe)
+
+                # Removed accounts are still registered until disconnected
+                with self._lock:
+                    self._removed.clear()
+                for key in list(selector.get_map().values()):
+                    if key.data is not None:
+                        self._disconnect(selector, key.data)
+        finally:
+            wake_pipe.close()
+
+    def _service(self, selector: selectors.BaseSelector, wake_pipe: _WakePipe) -> None:
+        """Run one pass: apply removals, (re)connect, refresh, then select.
+
+        Args:
+            selector: Selector with the wake pipe and IDLE sockets registered
+            wake_pipe: Pipe to drain when it wakes the selector
+        """
+        with self._lock:
+            removed, self._removed = self._removed, []
+            sessions = list(self._sessions.values())
+        for session in removed:
+            self._disconnect(selector, session)
+
+        timeout = self.MAX_SELECT_TIMEOUT
+        for session in sessions:
+            now = time.monotonic()
+            if session.sock is None:
+                if now >= session.retry_at:
+                    self._connect(selector, session)
+            elif now - session.idle_start >= IMAPIdleConnection.IDLE_TIMEOUT:
+                self._refresh(selector, session)
+
+            if session.sock is None:
+                deadline = session.retry_at
+            else:
+                deadline = session.idle_start + IMAPIdleConnection.IDLE_TIMEOUT
+            timeout = min(timeout, deadline - time.monotonic())
+
+        for key, _ in selector.select(timeout=max(timeout, 0)):
+            if key.data is None:
+                wake_pipe.drain()
+            elif key.data.sock is not None:
+                self._dispatch(selector, key.data)
+
+    def _connect(self, selector: selectors.BaseSelector, session: _IdleSession) -> None:
+        """Log in, enter IDLE and register the socket, or schedule a retry."""
+        idle = session.idle
+        if idle._connect() and idle._connection and idle._enter_idle():
+            session.sock = idle._connection.socket()
+            session.idle_start = time.monotonic()
+            selector.register(session.sock, selectors.EVENT_READ, session)
+            return
+
+        logger.warning(
+            f"IDLE connection failed for {idle.config.account_id}, "
+            f"retrying in {idle.RECONNECT_DELAY}s"
+        )
+        self._disconnect(selector, session)
+
+    def _refresh(self, selector: selectors.BaseSelector, session: _IdleSession) -> None:
+        """Leave and re-enter IDLE before the server's inactivity timeout."""
+        idle = session.idle
+        logger.debug(f"IDLE timeout refresh for {idle.config.account_id}")
+        try:
+            idle._exists_during_exit = False
+            if not idle._exit_idle():
+                raise ConnectionError("failed to exit IDLE")
+            if idle._exists_during_exit:
+                idle._notify_new_mail()
+            # NOOP to keep connection alive
+            if idle._connection:
+                idle._connection.noop()
+            if not idle._enter_idle():
+                raise ConnectionError("failed to re-enter IDLE")
+            session.idle_start = time.monotonic()
+        except Exception as e:
+            logger.warning(f"IDLE connection error for {idle.config.account_id}: {e}")
+            self._disconnect(selector, session)
+
+    def _dispatch(self, selector: selectors.BaseSelector, session: _IdleSession) -> None:
+        """Handle a readable IDLE socket."""
+        idle = session.idle
+        try:
+            if idle._read_pushes():
+                # Exit IDLE before callback
+                if not idle._exit_idle():
+                    raise ConnectionError("failed to exit IDLE")
+                idle._notify_new_mail()
+                if not idle._enter_idle():
+                    raise ConnectionError("failed to re-enter IDLE")
+                session.idle_start = time.monotonic()
+        except Exception as e:
+            logger.warning(f"IDLE connection error for {idle.config.account_id}: {e}")
+            self._disconnect(selector, session)
+
+    def _disconnect(self, selector: selectors.BaseSelector, session: _IdleSession) -> None:
+        """Unregister and log out an account's connection; retry after a delay."""
+        idle = session.idle
+        if session.sock is not None:
+            selector.unregister(session.sock)
+            session.sock = None
+        if idle._connection:
+            try:
+                if idle._idle_tag:
+                    idle._exit_idle()
+                idle._connection.logout()
+            except Exception:
+                pass
+            idle._connection = None
+        idle._idle_tag = None
+        session.retry_at = time.monotonic() + idle.RECONNECT_DELAY
+
+
 class IMAPIdleWatcher:
-    """Manages IDLE connections for multiple accounts."""
+    """Manages IDLE connections for multiple accounts on one runner thread."""
 
     def __init__(self, on_new_mail: Optional[Callable[[str], None]] = None):
         """Initialize the IDLE watcher.
@@ -322,6 +709,7 @@ class IMAPIdleWatcher:
         self._connections: Dict[str, IMAPIdleConnection] = {}
         self._default_callback = on_new_mail or self._default_on_new_mail
         self._enabled = True
+        self._runner = MultiplexedIdleRunner()
 
     def _default_on_new_mail(self, account_id: str):
         """Default callback when no callback provided."""
@@ -347,7 +735,8 @@ class IMAPIdleWatcher:
         self._connections[config.account_id] = connection
 
         if self._enabled:
-            connection.start()
+            self._runner.add_account(connection)
+            self._runner.start()
 
         logger.info(f"Added IDLE watcher for account {config.account_id}")
 
@@ -360,27 +749,29 @@ class IMAPIdleWatcher:
         if account_id not in self._connections:
             return
 
-        connection = self._connections.pop(account_id)
-        connection.stop()
+        self._connections.pop(account_id)
+        self._runner.remove_account(account_id)
         logger.info(f"Removed IDLE watcher for account {account_id}")
 
     def start_all(self):
         """Start watching all accounts."""
         self._enabled = True
-        for account_id, connection in self._connections.items():
-            try:
-                connection.start()
-            except Exception as e:
-                logger.error(f"Failed to start IDLE for {account_id}: {e}")
+        for connection in self._connections.values():
+            self._runner.add_account(connection)
+        try:
+            self._runner.start()
+        except Exception as e:
+            logger.error(f"Failed to start IDLE runner: {e}")
 
     def stop_all(self):
         """Stop watching all accounts."""
         self._enabled = False
-        for account_id, connection in self._connections.items():
-            try:
-                connection.stop()
-            except Exception as e:
-                logger.error(f"Failed to stop IDLE for {account_id}: {e}")
+        for account_id in self._connections:
+            self._runner.remove_account(account_id)
+        try:
+            self._runner.stop()
+        except Exception as e:
+            logger.error(f"Failed to stop IDLE runner: {e}")
 
     def get_watched_accounts(self) -> List[str]:
         """Get list of accounts being watched.
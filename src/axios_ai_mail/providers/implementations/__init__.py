@@ -1,5 +1,21 @@
 """Provider implementations."""
 
-from .gmail import GmailProvider, GmailConfig
+import importlib
+from typing import Any
+
+# Loaded on first access so importing one implementation doesn't pull in the other
+_LAZY_EXPORTS = {
+    "GmailProvider": ".gmail",
+    "GmailConfig": ".gmail",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import provider implementations on first attribute access (PEP 562)."""
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["GmailProvider", "GmailConfig"]
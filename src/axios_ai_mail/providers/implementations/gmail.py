@@ -1,24 +1,94 @@
 """Gmail API provider implementation."""
 
-import email.utils
 import logging
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Set
 
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from googleapiclient.model import JsonModel
 
 from ...credentials import Credentials as CredLoader, CredentialError
 from ..base import BaseEmailProvider, Message, ProviderConfig
 from ..registry import ProviderRegistry
 
+try:
+    # SIMD-accelerated base64, much faster on large bodies and attachments
+    from pybase64 import urlsafe_b64decode, urlsafe_b64encode
+except ImportError:
+    from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+try:
+    # Faster JSON parsing for large format="full" responses
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class _OrjsonModel(JsonModel):
+    """googleapiclient response model that parses bodies with orjson."""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Not JSON; the stock model returns it as text
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+# Model passed to build(); None keeps googleapiclient's stdlib JsonModel
+_JSON_MODEL = _OrjsonModel() if orjson is not None else None
+
+
+def _parts_mask(part_fields: str, depth: int) -> str:
+    """Build a partial-response mask selecting part_fields on nested MIME parts.
+
+    Parts nested deeper than depth are returned whole rather than cut off.
+    """
+    mask = "parts"
+    for _ in range(depth):
+        mask = f"parts({part_fields},{mask})"
+    return mask
+
+
+# Fields _parse_gmail_message reads; part headers and sizes are left out
+_MESSAGE_PART_FIELDS = "mimeType,filename,body(data,attachmentId)"
+_MESSAGE_FIELDS = (
+    "id,threadId,labelIds,snippet,internalDate,"
+    f"payload(headers,{_MESSAGE_PART_FIELDS},{_parts_mask(_MESSAGE_PART_FIELDS, 4)})"
+)
+
+# Headers read from a message, and from an attachment part
+_MESSAGE_HEADERS = frozenset(("Subject", "From", "To"))
+_ATTACHMENT_HEADERS = frozenset(("Content-Disposition", "Content-ID"))
+
+# System labels that place a message in a folder, in precedence order;
+# anything else is in the inbox
+_FOLDER_MAP = (("SENT", "sent"), ("TRASH", "trash"), ("DRAFT", "drafts"), ("SPAM", "spam"))
+
+# Fields list_attachments reads; inline body data is left out
+_ATTACHMENT_PART_FIELDS = "mimeType,filename,headers,body(attachmentId,size)"
+_ATTACHMENT_FIELDS = (
+    f"payload({_ATTACHMENT_PART_FIELDS},{_parts_mask(_ATTACHMENT_PART_FIELDS, 4)})"
+)
+
+
+@dataclass(slots=True)
 class GmailConfig(ProviderConfig):
     """Gmail-specific configuration."""
 
@@ -51,6 +121,33 @@ class GmailProvider(BaseEmailProvider):
         "https://www.googleapis.com/auth/gmail.readonly",
     ]
 
+    # Message IDs per messages.list page (API maximum)
+    LIST_PAGE_SIZE = 500
+
+    # Sub-requests per batch HTTP call. The API accepts up to 100, but Gmail
+    # rate-limits batches larger than 50.
+    BATCH_SIZE = 50
+
+    # Concurrent single gets used to retry messages a batch couldn't fetch,
+    # kept low to stay under Gmail's per-user rate limits
+    MAX_FETCH_WORKERS = 10
+
+    # Sub-request statuses worth retrying outside the batch
+    RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    # Seconds a fetched label listing is reused before listing again
+    LABEL_CACHE_TTL = 300
+
+    # Message IDs per batchModify request (API maximum)
+    BATCH_MODIFY_SIZE = 1000
+
+    # Socket timeout for Gmail API calls, in seconds
+    HTTP_TIMEOUT = 30
+
+    # Per-credential-file locks so concurrent providers refresh a token once
+    _token_locks: Dict[str, threading.Lock] = {}
+    _token_locks_guard = threading.Lock()
+
     def __init__(self, config: GmailConfig):
         """Initialize Gmail provider.
 
@@ -61,59 +158,23 @@ class GmailProvider(BaseEmailProvider):
         self.config: GmailConfig = config
         self.service = None
         self.creds: Optional[Credentials] = None
+        # Authorized transport kept for the provider's lifetime, so every API
+        # call reuses its keep-alive connection to gmail.googleapis.com
+        self._http: Optional[AuthorizedHttp] = None
+        # When _label_cache was last fetched (time.monotonic)
+        self._label_cache_ts: float = 0.0
 
     def authenticate(self) -> None:
         """Authenticate with Gmail API using OAuth2."""
         try:
-            # Load OAuth token from credential file
-            token_data = CredLoader.load_oauth_token(self.config.credential_file)
-
-            # Create credentials object with expiry if available
-            # This allows proactive refresh instead of waiting for 401
-            self.creds = Credentials(
-                token=token_data["access_token"],
-                refresh_token=token_data["refresh_token"],
-                token_uri="https://oauth2.googleapis.com/token",
-                client_id=token_data["client_id"],
-                client_secret=token_data["client_secret"],
-                scopes=self.SCOPES,
-                expiry=token_data.get("expiry"),  # datetime or None
-            )
-
-            # Refresh token if expired or will expire within 5 minutes
-            # The google-auth library checks creds.expired but we also do a
-            # proactive check with a 5-minute buffer to avoid 401s
-            needs_refresh = False
-            if self.creds.expired:
-                needs_refresh = True
-                logger.debug(f"Token expired for {self.email}")
-            elif self.creds.expiry:
-                # Check if token expires within 5 minutes
-                buffer = timedelta(minutes=5)
-                if self.creds.expiry <= datetime.now(timezone.utc) + buffer:
-                    needs_refresh = True
-                    logger.debug(f"Token for {self.email} expires soon, refreshing proactively")
-
-            if needs_refresh and self.creds.refresh_token:
-                logger.info(f"Refreshing OAuth token for {self.email}")
-                self.creds.refresh(Request())
-
-                # Save updated token with new expiry
-                try:
-                    updated_token = {
-                        "access_token": self.creds.token,
-                        "refresh_token": self.creds.refresh_token,
-                        "client_id": token_data["client_id"],
-                        "client_secret": token_data["client_secret"],
-                        "expiry": self.creds.expiry,  # datetime object
-                    }
-                    CredLoader.save_oauth_token(self.config.credential_file, updated_token)
-                    logger.debug(f"Saved refreshed token with expiry {self.creds.expiry}")
-                except Exception as e:
-                    logger.warning(f"Could not save refreshed token: {e}")
+            # Serialize refreshes per token file: a caller that waited here
+            # reloads the token another provider just refreshed and saved
+            with self._token_lock(self.config.credential_file):
+                self.creds = self._load_credentials()
 
             # Build Gmail service
-            self.service = build("gmail", "v1", credentials=self.creds)
+            self._http = AuthorizedHttp(self.creds, http=httplib2.Http(timeout=self.HTTP_TIMEOUT))
+            self.service = build("gmail", "v1", http=self._http, model=_JSON_MODEL)
             logger.info(f"Successfully authenticated with Gmail for {self.email}")
 
         except CredentialError as e:
@@ -123,14 +184,86 @@ class GmailProvider(BaseEmailProvider):
             logger.error(f"Authentication failed for {self.email}: {e}")
             raise
 
+    @classmethod
+    def _token_lock(cls, credential_file: str) -> threading.Lock:
+        """Get the lock guarding refreshes of one token file."""
+        with cls._token_locks_guard:
+            return cls._token_locks.setdefault(credential_file, threading.Lock())
+
+    def _load_credentials(self) -> Credentials:
+        """Load the OAuth token, refreshing and saving it if it expires soon.
+
+        Returns:
+            Valid credentials
+        """
+        # Load OAuth token from credential file
+        token_data = CredLoader.load_oauth_token(self.config.credential_file)
+
+        # google-auth compares expiry against naive UTC, so drop the timezone
+        # the loader attaches
+        expiry = token_data.get("expiry")
+        if expiry is not None and expiry.tzinfo is not None:
+            expiry = expiry.astimezone(timezone.utc).replace(tzinfo=None)
+
+        # Create credentials object with expiry if available
+        # This allows proactive refresh instead of waiting for 401
+        creds = Credentials(
+            token=token_data["access_token"],
+            refresh_token=token_data["refresh_token"],
+            token_uri="https://oauth2.googleapis.com/token",
+            client_id=token_data["client_id"],
+            client_secret=token_data["client_secret"],
+            scopes=self.SCOPES,
+            expiry=expiry,
+        )
+
+        # Refresh token if expired or will expire within 5 minutes
+        # The google-auth library checks creds.expired but we also do a
+        # proactive check with a 5-minute buffer to avoid 401s
+        needs_refresh = False
+        if creds.expired:
+            needs_refresh = True
+            logger.debug(f"Token expired for {self.email}")
+        elif creds.expiry:
+            # Check if token expires within 5 minutes
+            buffer = timedelta(minutes=5)
+            if creds.expiry <= datetime.now(timezone.utc).replace(tzinfo=None) + buffer:
+                needs_refresh = True
+                logger.debug(f"Token for {self.email} expires soon, refreshing proactively")
+
+        if needs_refresh and creds.refresh_token:
+            logger.info(f"Refreshing OAuth token for {self.email}")
+            creds.refresh(Request())
+
+            # Save updated token with new expiry so the next start skips the refresh
+            try:
+                updated_token = {
+                    "access_token": creds.token,
+                    "refresh_token": creds.refresh_token,
+                    "client_id": token_data["client_id"],
+                    "client_secret": token_data["client_secret"],
+                    "expiry": creds.expiry.replace(tzinfo=timezone.utc) if creds.expiry else None,
+                }
+                CredLoader.save_oauth_token(self.config.credential_file, updated_token)
+                logger.debug(f"Saved refreshed token with expiry {creds.expiry}")
+            except Exception as e:
+                logger.warning(f"Could not save refreshed token: {e}")
+
+        return creds
+
     def fetch_messages(
-        self, since: Optional[datetime] = None, max_results: int = 100
+        self,
+        since: Optional[datetime] = None,
+        max_results: int = 100,
+        known_ids: Optional[Set[str]] = None,
     ) -> List[Message]:
         """Fetch messages from Gmail.
 
         Args:
             since: Only fetch messages newer than this timestamp
             max_results: Maximum number of messages to fetch
+            known_ids: Message IDs already stored locally; listed messages
+                among them are not downloaded again
 
         Returns:
             List of Message objects
@@ -139,8 +272,6 @@ class GmailProvider(BaseEmailProvider):
             self.authenticate()
 
         try:
-            messages = []
-
             # Build query - fetch from all mail (inbox, sent, trash)
             # Use "in:all" to search everywhere, then exclude drafts and spam
             query = "in:all -in:draft -in:spam"
@@ -149,38 +280,169 @@ class GmailProvider(BaseEmailProvider):
                 date_str = since.strftime("%Y/%m/%d")
                 query += f" after:{date_str}"
 
-            # Fetch message list
-            results = (
-                self.service.users()
-                .messages()
-                .list(userId="me", q=query, maxResults=max_results)
-                .execute()
-            )
+            messages: List[Message] = []
+            remaining = max_results
+            page = self._list_messages_page(query, remaining)
+
+            # While one page's details download, the next page is listed on a
+            # background thread so the two round-trips overlap
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="gmail-list") as lister:
+                while True:
+                    message_items = page.get("messages", [])[:remaining]
+                    remaining -= len(message_items)
+                    logger.info(f"Fetched {len(message_items)} messages from Gmail")
+
+                    page_token = page.get("nextPageToken")
+                    next_page = None
+                    if page_token and remaining > 0:
+                        next_page = lister.submit(
+                            self._list_messages_page,
+                            query,
+                            remaining,
+                            page_token,
+                            self._new_http(),
+                        )
+
+                    # Fetch full message details, skipping messages we already have
+                    message_ids = [item["id"] for item in message_items]
+                    if known_ids:
+                        message_ids = [msg_id for msg_id in message_ids if msg_id not in known_ids]
+                        logger.debug(
+                            f"Skipping {len(message_items) - len(message_ids)} "
+                            "already stored messages"
+                        )
+                    messages.extend(self._fetch_message_details(message_ids))
+
+                    if next_page is None:
+                        return messages
+                    page = next_page.result()
+
+        except HttpError as e:
+            logger.error(f"Gmail API error while fetching messages: {e}")
+            raise
+
+    def _list_messages_page(
+        self,
+        query: str,
+        max_results: int,
+        page_token: Optional[str] = None,
+        http: Optional[AuthorizedHttp] = None,
+    ) -> Dict:
+        """List one page of message IDs matching query.
+
+        Args:
+            query: Gmail search query
+            max_results: Maximum IDs wanted; capped at LIST_PAGE_SIZE
+            page_token: nextPageToken of the previous page
+            http: Transport to use instead of the service's own, for calls
+                made off the calling thread
+
+        Returns:
+            messages.list response
+        """
+        params = {"userId": "me", "q": query, "maxResults": min(max_results, self.LIST_PAGE_SIZE)}
+        if page_token:
+            params["pageToken"] = page_token
+        return self.service.users().messages().list(**params).execute(http=http)
+
+    def _new_http(self) -> Optional[AuthorizedHttp]:
+        """Create a transport for a worker thread.
+
+        httplib2 connections aren't thread-safe, so calls made off the
+        calling thread can't share the service's transport.
+        """
+        if not self.creds:
+            return None
+        return AuthorizedHttp(self.creds, http=httplib2.Http(timeout=self.HTTP_TIMEOUT))
+
+    def _fetch_message_details(self, message_ids: List[str]) -> List[Message]:
+        """Fetch and parse full messages, BATCH_SIZE get requests per HTTP call.
 
-            message_items = results.get("messages", [])
-            logger.info(f"Fetched {len(message_items)} messages from Gmail")
+        Responses are parsed on a background thread as each batch completes,
+        so parsing one batch overlaps the network wait for the next.
 
-            # Fetch full message details
-            for item in message_items:
-                msg_id = item["id"]
+        Messages whose sub-request was rate limited or hit a server error,
+        and every message of a batch that failed outright, are retried with
+        concurrent single gets. Other failures are logged and skipped.
+
+        Args:
+            message_ids: Gmail message IDs to fetch
+
+        Returns:
+            Parsed messages, in the order of message_ids
+        """
+        parsing: Dict[str, Future] = {}
+        retry: List[str] = []
+
+        # Parsing is pure Python, but the batch HTTP calls release the GIL
+        # while waiting, so one parser thread is enough to overlap them.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="gmail-parse") as parser:
+
+            def on_response(
+                request_id: str, response: Dict, exception: Optional[HttpError]
+            ) -> None:
+                if exception is None:
+                    parsing[request_id] = parser.submit(self._parse_gmail_message, response)
+                elif exception.resp.status in self.RETRYABLE_STATUSES:
+                    retry.append(request_id)
+                else:
+                    logger.warning(f"Failed to fetch message {request_id}: {exception}")
+
+            for start in range(0, len(message_ids), self.BATCH_SIZE):
+                chunk = message_ids[start : start + self.BATCH_SIZE]
+                batch = self.service.new_batch_http_request(callback=on_response)
+                for msg_id in chunk:
+                    batch.add(self._get_message_request(msg_id), request_id=msg_id)
                 try:
-                    msg_detail = (
-                        self.service.users()
-                        .messages()
-                        .get(userId="me", id=msg_id, format="full")
-                        .execute()
+                    batch.execute()
+                except (HttpError, OSError, httplib2.HttpLib2Error) as e:
+                    logger.warning(f"Batch fetch of {len(chunk)} messages failed: {e}")
+                    retry.extend(
+                        msg_id for msg_id in chunk if msg_id not in parsing and msg_id not in retry
                     )
-                    message = self._parse_gmail_message(msg_detail)
-                    messages.append(message)
-                except HttpError as e:
-                    logger.warning(f"Failed to fetch message {msg_id}: {e}")
-                    continue
 
-            return messages
+            fetched = {msg_id: future.result() for msg_id, future in parsing.items()}
 
-        except HttpError as e:
-            logger.error(f"Gmail API error while fetching messages: {e}")
-            raise
+        if retry:
+            fetched.update(self._fetch_messages_concurrently(retry))
+
+        return [fetched[msg_id] for msg_id in message_ids if msg_id in fetched]
+
+    def _get_message_request(self, msg_id: str) -> HttpRequest:
+        """Build a messages.get request for the fields the parser needs."""
+        return (
+            self.service.users()
+            .messages()
+            .get(userId="me", id=msg_id, format="full", fields=_MESSAGE_FIELDS)
+        )
+
+    def _fetch_messages_concurrently(self, message_ids: List[str]) -> Dict[str, Message]:
+        """Fetch and parse messages with up to MAX_FETCH_WORKERS parallel gets.
+
+        Args:
+            message_ids: Gmail message IDs to fetch
+
+        Returns:
+            Parsed messages by ID; messages that fail are logged and skipped
+        """
+
+        def fetch(msg_id: str) -> Dict:
+            return self._get_message_request(msg_id).execute(http=self._new_http())
+
+        logger.info(f"Fetching {len(message_ids)} Gmail message(s) individually")
+        fetched: Dict[str, Message] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(len(message_ids), self.MAX_FETCH_WORKERS),
+            thread_name_prefix="gmail-fetch",
+        ) as executor:
+            futures = [(msg_id, executor.submit(fetch, msg_id)) for msg_id in message_ids]
+            for msg_id, future in futures:
+                try:
+                    fetched[msg_id] = self._parse_gmail_message(future.result())
+                except (HttpError, OSError, httplib2.HttpLib2Error) as e:
+                    logger.warning(f"Failed to fetch message {msg_id}: {e}")
+
+        return fetched
 
     def _parse_gmail_message(self, msg_detail: Dict) -> Message:
         """Parse Gmail API message into normalized Message object.
@@ -191,73 +453,63 @@ class GmailProvider(BaseEmailProvider):
         Returns:
             Normalized Message object
         """
-        headers = {h["name"]: h["value"] for h in msg_detail["payload"]["headers"]}
+        headers = {
+            h["name"]: h["value"]
+            for h in msg_detail["payload"]["headers"]
+            if h["name"] in _MESSAGE_HEADERS
+        }
 
         # Extract email body (text and HTML)
-        import base64
         body_text = None
         body_html = None
 
         has_attachments = False
 
-        def extract_body_parts(payload):
-            """Recursively extract body text and HTML from payload."""
-            nonlocal body_text, body_html, has_attachments
-
-            mime_type = payload.get("mimeType", "")
+        # Walk the MIME tree depth-first in document order, so the first
+        # text/plain and text/html leaves win
+        stack = [msg_detail["payload"]]
+        while stack:
+            payload = stack.pop()
 
-            # If this is a multipart, recurse into parts
+            # If this is a multipart, visit its parts next
             if "parts" in payload:
-                for part in payload["parts"]:
-                    extract_body_parts(part)
+                stack.extend(reversed(payload["parts"]))
+                continue
+
+            # This is a leaf part - check for attachments (parts with
+            # filename or attachmentId) before body content
+            body = payload.get("body", {})
+            if payload.get("filename") or body.get("attachmentId"):
+                has_attachments = True
             else:
-                # This is a leaf part - check if it's body content
-                body_data = payload.get("body", {}).get("data", "")
-
-                # Check for attachments (parts with filename or attachmentId)
-                if payload.get("filename") or payload.get("body", {}).get("attachmentId"):
-                    has_attachments = True
-                    return
-
-                if body_data:
-                    try:
-                        decoded = base64.urlsafe_b64decode(body_data).decode("utf-8")
-                        if mime_type == "text/plain" and not body_text:
-                            body_text = decoded
-                        elif mime_type == "text/html" and not body_html:
-                            body_html = decoded
-                    except Exception:
-                        pass
-
-        extract_body_parts(msg_detail["payload"])
+                # Only decode parts that fill a still-empty body; other text
+                # parts (text/calendar, a second text/plain, ...) are skipped
+                mime_type = payload.get("mimeType")
+                if mime_type == "text/plain":
+                    if not body_text:
+                        body_text = self._decode_body(body)
+                elif mime_type == "text/html":
+                    if not body_html:
+                        body_html = self._decode_body(body)
+
+            # Nothing left to find
+            if body_text and body_html and has_attachments:
+                break
 
         # Extract labels
-        label_ids = msg_detail.get("labelIds", [])
-        labels = set(label_ids)  # Will map to human-readable names later
-
-        # Detect folder from Gmail labels
-        folder = "inbox"  # Default
-        if "SENT" in label_ids:
-            folder = "sent"
-        elif "TRASH" in label_ids:
-            folder = "trash"
-        elif "DRAFT" in label_ids:
-            folder = "drafts"
-        elif "SPAM" in label_ids:
-            folder = "spam"
-        # INBOX is default
-
-        # Parse date from email Date header
-        # Convert to local time and store as naive datetime for correct display
+        # Interned so every message shares one copy of "INBOX", "UNREAD", ...
+        # Message.__post_init__ already shares equal label sets, but the
+        # strings themselves would otherwise repeat across distinct sets.
+        labels = frozenset(map(sys.intern, msg_detail.get("labelIds", ())))
+
+        # Detect folder from Gmail labels (INBOX is default)
+        folder = next((name for label, name in _FOLDER_MAP if label in labels), "inbox")
+
+        # Use Gmail's internalDate (ms since epoch, the time Gmail received
+        # the message and sorts by) rather than parsing the Date header.
+        # Store as naive local time for correct display
         # (JS interprets naive datetime strings as local time)
-        date_str = headers.get("Date", "")
-        try:
-            date = email.utils.parsedate_to_datetime(date_str)
-            # Convert to local time and make naive for storage
-            date = date.astimezone().replace(tzinfo=None)
-        except Exception:
-            # Fallback to internalDate if Date header parsing fails
-            date = datetime.fromtimestamp(int(msg_detail["internalDate"]) / 1000)
+        date = datetime.fromtimestamp(int(msg_detail["internalDate"]) / 1000)
 
         return Message(
             id=msg_detail["id"],
@@ -270,11 +522,22 @@ class GmailProvider(BaseEmailProvider):
             body_text=body_text,
             body_html=body_html,
             labels=labels,
-            is_unread="UNREAD" in label_ids,
+            is_unread="UNREAD" in labels,
             folder=folder,
             has_attachments=has_attachments,
         )
 
+    @staticmethod
+    def _decode_body(body: Dict) -> Optional[str]:
+        """Decode a part's base64url body data, or None if empty or not UTF-8."""
+        body_data = body.get("data")
+        if not body_data:
+            return None
+        try:
+            return urlsafe_b64decode(body_data).decode("utf-8")
+        except Exception:
+            return None
+
     def update_labels(
         self, message_id: str, add_labels: Set[str], remove_labels: Set[str]
     ) -> None:
@@ -285,6 +548,18 @@ class GmailProvider(BaseEmailProvider):
             add_labels: Label names to add
             remove_labels: Label names to remove
         """
+        self.batch_update_labels([message_id], add_labels, remove_labels)
+
+    def batch_update_labels(
+        self, message_ids: List[str], add_labels: Set[str], remove_labels: Set[str]
+    ) -> None:
+        """Update labels on several Gmail messages with batchModify.
+
+        Args:
+            message_ids: Gmail message IDs
+            add_labels: Label names to add
+            remove_labels: Label names to remove
+        """
         if not self.service:
             self.authenticate()
 
@@ -292,34 +567,34 @@ class GmailProvider(BaseEmailProvider):
             # Map label names to IDs
             label_mapping = self.list_labels()
 
-            add_label_ids = [
-                label_mapping[name] for name in add_labels if name in label_mapping
-            ]
-            remove_label_ids = [
-                label_mapping[name] for name in remove_labels if name in label_mapping
-            ]
+            # Unknown names drop out in the set intersection
+            known_labels = label_mapping.keys()
+            add_label_ids = [label_mapping[name] for name in known_labels & add_labels]
+            remove_label_ids = [label_mapping[name] for name in known_labels & remove_labels]
 
             if not add_label_ids and not remove_label_ids:
-                logger.debug(f"No label changes for message {message_id}")
+                logger.debug(f"No label changes for {len(message_ids)} message(s)")
                 return
 
-            # Update labels
-            body = {
-                "addLabelIds": add_label_ids,
-                "removeLabelIds": remove_label_ids,
-            }
-
-            self.service.users().messages().modify(
-                userId="me", id=message_id, body=body
-            ).execute()
+            # Update labels, up to BATCH_MODIFY_SIZE messages per request
+            for start in range(0, len(message_ids), self.BATCH_MODIFY_SIZE):
+                body = {
+                    "ids": message_ids[start : start + self.BATCH_MODIFY_SIZE],
+                    "addLabelIds": add_label_ids,
+                    "removeLabelIds": remove_label_ids,
+                }
+                self.service.users().messages().batchModify(userId="me", body=body).execute()
 
             logger.info(
-                f"Updated labels on message {message_id}: "
+                f"Updated labels on {len(message_ids)} message(s): "
                 f"+{len(add_label_ids)} -{len(remove_label_ids)}"
             )
 
         except HttpError as e:
-            logger.error(f"Failed to update labels on message {message_id}: {e}")
+            if e.resp.status in (404, 409):
+                # A cached label may have been deleted or renamed
+                self._label_cache = None
+            logger.error(f"Failed to update labels on {len(message_ids)} message(s): {e}")
             raise
 
     def create_label(self, name: str, color: Optional[str] = None) -> str:
@@ -358,21 +633,34 @@ class GmailProvider(BaseEmailProvider):
 
             logger.info(f"Created Gmail label: {name} (ID: {label_id})")
 
-            # Invalidate cache
-            self._label_cache = None
+            # Update cache in place rather than forcing a full re-list
+            if self._label_cache is not None:
+                self._label_cache[name] = label_id
 
             return label_id
 
         except HttpError as e:
+            if e.resp.status in (404, 409):
+                # Someone else created it since we listed labels
+                self._label_cache = None
             logger.error(f"Failed to create label '{name}': {e}")
             raise
 
     def list_labels(self) -> Dict[str, str]:
         """Get all Gmail labels.
 
+        The listing is cached for LABEL_CACHE_TTL seconds, so labeling many
+        messages doesn't re-list labels for each one.
+
         Returns:
             Dict mapping label name to label ID
         """
+        if (
+            self._label_cache is not None
+            and time.monotonic() - self._label_cache_ts < self.LABEL_CACHE_TTL
+        ):
+            return self._label_cache
+
         if not self.service:
             self.authenticate()
 
@@ -383,6 +671,8 @@ class GmailProvider(BaseEmailProvider):
             label_mapping = {label["name"]: label["id"] for label in labels}
             logger.debug(f"Fetched {len(label_mapping)} labels from Gmail")
 
+            self._label_cache = label_mapping
+            self._label_cache_ts = time.monotonic()
             return label_mapping
 
         except HttpError as e:
@@ -498,8 +788,6 @@ class GmailProvider(BaseEmailProvider):
         Raises:
             RuntimeError: If send fails or quota exceeded
         """
-        import base64
-
         if not self.service:
             self.authenticate()
 
@@ -510,7 +798,7 @@ class GmailProvider(BaseEmailProvider):
                 raise RuntimeError(f"Message exceeds 25MB limit ({size_mb:.2f}MB)")
 
             # Encode message as base64 URL-safe
-            encoded_message = base64.urlsafe_b64encode(mime_message).decode("utf-8")
+            encoded_message = urlsafe_b64encode(mime_message).decode("utf-8")
 
             # Build request body
             body = {"raw": encoded_message}
@@ -554,19 +842,25 @@ class GmailProvider(BaseEmailProvider):
         try:
             # Fetch message with payload
             message = self.service.users().messages().get(
-                userId="me", id=message_id, format="full"
+                userId="me", id=message_id, format="full", fields=_ATTACHMENT_FIELDS
             ).execute()
 
             attachments = []
             payload = message.get("payload", {})
 
-            # Recursively find all parts with filenames
-            def extract_attachments(part):
+            # Find all parts with filenames, depth-first in document order
+            stack = [payload]
+            while stack:
+                part = stack.pop()
                 if "filename" in part and part["filename"]:
                     attachment_id = part["body"].get("attachmentId")
                     if attachment_id:
                         # Headers is a list of {name, value} dicts, not a dict
-                        headers = {h["name"]: h["value"] for h in part.get("headers", [])}
+                        headers = {
+                            h["name"]: h["value"]
+                            for h in part.get("headers", [])
+                            if h["name"] in _ATTACHMENT_HEADERS
+                        }
                         content_disposition = headers.get("Content-Disposition", "")
                         # Get Content-ID for inline images (used for cid: references)
                         content_id = headers.get("Content-ID", "")
@@ -583,12 +877,9 @@ class GmailProvider(BaseEmailProvider):
                             "content_id": content_id,
                         })
 
-                # Recurse into multipart parts
+                # Visit multipart parts next
                 if "parts" in part:
-                    for subpart in part["parts"]:
-                        extract_attachments(subpart)
-
-            extract_attachments(payload)
+                    stack.extend(reversed(part["parts"]))
 
             logger.debug(f"Found {len(attachments)} attachments in message {message_id}")
             return attachments
@@ -614,19 +905,18 @@ class GmailProvider(BaseEmailProvider):
         Raises:
             RuntimeError: If attachment not found or download fails
         """
-        import base64
-
         if not self.service:
             self.authenticate()
 
         try:
-            # Download attachment via Gmail API
+            # Download attachment via Gmail API. attachments.get has no media
+            # endpoint, so the body always arrives base64-encoded in JSON.
             attachment = self.service.users().messages().attachments().get(
-                userId="me", messageId=message_id, id=attachment_id
+                userId="me", messageId=message_id, id=attachment_id, fields="data"
             ).execute()
 
-            # Decode base64 data
-            data = base64.urlsafe_b64decode(attachment["data"])
+            # Decode base64 data, dropping the encoded copy as soon as it's used
+            data = urlsafe_b64decode(attachment.pop("data"))
 
             logger.debug(f"Downloaded attachment {attachment_id} ({len(data)} bytes)")
             return data
@@ -1,13 +1,19 @@
 """IMAP email provider with KEYWORD extension support."""
 
 import email
+import html
 import imaplib
 import logging
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from email.header import decode_header
-from typing import Dict, List, Optional, Set
+from email.parser import BytesParser
+from email.utils import formataddr, getaddresses
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from ..base import BaseEmailProvider, Message, ProviderConfig
 from ..connection_pool import get_connection_pool
@@ -15,8 +21,26 @@ from ...credentials import Credentials
 
 logger = logging.getLogger(__name__)
 
+# Patterns used once per fetched message. Servers may put FLAGS before or
+# after the message literal, so the flags pattern isn't anchored to either.
+_FLAGS_RE = re.compile(r"FLAGS \(([^)]*)\)")
+_UID_RE = re.compile(rb"UID (\d+)")
+_ESEARCH_ALL_RE = re.compile(rb"\bALL ([\d:,]+)")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_HTML_SCRIPT_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
 
-@dataclass
+# LIST response folder names: a trailing quoted name, or whatever follows the
+# delimiter (see _parse_list_response)
+_LIST_QUOTED_NAME_RE = re.compile(r'"([^"]+)"$')
+_LIST_NAME_RE = re.compile(r'\)\s+(?:"[^"]*"|NIL)\s+(.+)$')
+
+# Shared by every message parse; BytesParser keeps no per-parse state. The
+# default compat32 policy matches email.message_from_bytes, which the header
+# and payload handling below relies on.
+_BYTES_PARSER = BytesParser()
+
+
+@dataclass(slots=True)
 class IMAPConfig(ProviderConfig):
     """IMAP-specific configuration."""
 
@@ -26,6 +50,14 @@ class IMAPConfig(ProviderConfig):
     folder: str = "INBOX"
     keyword_prefix: str = "$"  # Prefix for IMAP keywords (e.g., $work, $finance)
 
+    # Messages per UID FETCH command. Each response holds full messages in
+    # memory, and some servers reject very long UID sets, so keep it modest.
+    fetch_batch_size: int = 50
+
+    # Connections used to fetch folders in parallel when syncing all folders,
+    # including the provider's own. Extra ones are borrowed from the pool.
+    folder_fetch_connections: int = 2
+
     # SMTP settings for sending
     smtp_host: Optional[str] = None
     smtp_port: int = 587
@@ -37,16 +69,21 @@ class IMAPConfig(ProviderConfig):
 class IMAPProvider(BaseEmailProvider):
     """IMAP email provider with KEYWORD extension support for tag synchronization."""
 
+    # UIDs per STORE command, to stay under servers' command length limits
+    STORE_BATCH_SIZE = 1000
+
     def __init__(self, config: IMAPConfig):
         super().__init__(config)
         self.connection: Optional[imaplib.IMAP4_SSL] = None
         self._supports_keywords: Optional[bool] = None
+        self._supports_esearch: bool = False
         self._current_folder: Optional[str] = None
         self._folder_mapping: Optional[Dict[str, str]] = None  # Cache discovered folder mapping
         self._using_pool: bool = False  # Track if we got connection from pool
+        self._registered_invalidation: bool = False
 
-    def _create_connection(self) -> imaplib.IMAP4_SSL:
-        """Create a new IMAP connection (used by pool)."""
+    def create_connection(self) -> imaplib.IMAP4_SSL:
+        """Create a new logged-in IMAP connection (used by the connection pool)."""
         logger.info(f"Authenticating IMAP: {self.config.email}@{self.config.host}")
 
         # Load password from credential file
@@ -71,9 +108,14 @@ class IMAPProvider(BaseEmailProvider):
         # Get or create connection from pool
         self.connection = pool.get_connection(
             account_id=self.config.account_id,
-            create_fn=self._create_connection,
+            create_fn=self.create_connection,
         )
         self._using_pool = True
+        if not self._registered_invalidation:
+            pool.register_invalidation_callback(
+                self.config.account_id, self._invalidate_folder_cache
+            )
+            self._registered_invalidation = True
 
         # Check for KEYWORD capability (only on first connect or reconnect)
         if self._supports_keywords is None:
@@ -81,24 +123,30 @@ class IMAPProvider(BaseEmailProvider):
             if typ == "OK":
                 capabilities_str = capabilities[0].decode("utf-8", errors="ignore")
                 self._supports_keywords = "KEYWORD" in capabilities_str
+                self._supports_esearch = "ESEARCH" in capabilities_str.split()
                 logger.info(
                     f"IMAP KEYWORD extension: {'supported' if self._supports_keywords else 'not supported'}"
                 )
 
+    def _invalidate_folder_cache(self, account_id: str) -> None:
+        """Forget folder state after the pool drops a connection for this account."""
+        self._folder_mapping = None
+        self._current_folder = None
+
     def release(self) -> None:
         """Release connection back to pool (keep alive for reuse)."""
         if self._using_pool and self.connection:
             pool = get_connection_pool()
-            pool.release_connection(self.config.account_id)
+            pool.release_connection(self.config.account_id, self.connection)
             logger.debug(f"Released IMAP connection for {self.config.account_id} to pool")
         self.connection = None
         self._using_pool = False
 
     def close(self) -> None:
         """Close connection (remove from pool)."""
-        if self._using_pool:
+        if self._using_pool and self.connection:
             pool = get_connection_pool()
-            pool.close_connection(self.config.account_id)
+            pool.close_connection(self.config.account_id, self.connection)
             logger.debug(f"Closed IMAP connection for {self.config.account_id}")
         elif self.connection:
             try:
@@ -179,7 +227,7 @@ class IMAPProvider(BaseEmailProvider):
 
             # Parse email
             raw_email = msg_data[0][1]
-            email_message = email.message_from_bytes(raw_email)
+            email_message = _BYTES_PARSER.parsebytes(raw_email)
 
             # Extract bodies
             body_text, body_html = self._extract_body(email_message)
@@ -248,14 +296,14 @@ class IMAPProvider(BaseEmailProvider):
         """
         # Strategy 1: Match last quoted string (most common)
         # Example: '(\HasNoChildren) "/" "INBOX.Sent"'
-        match = re.search(r'"([^"]+)"$', list_line)
+        match = _LIST_QUOTED_NAME_RE.search(list_line)
         if match:
             return match.group(1)
 
         # Strategy 2: Match everything after delimiter (quoted or NIL)
         # Example: '(\HasNoChildren) "/" INBOX.Sent'
         # Example: '(\HasNoChildren) NIL INBOX'
-        match = re.search(r'\)\s+(?:"[^"]*"|NIL)\s+(.+)$', list_line)
+        match = _LIST_NAME_RE.search(list_line)
         if match:
             folder_name = match.group(1).strip().strip('"\'')
             return folder_name
@@ -356,10 +404,15 @@ class IMAPProvider(BaseEmailProvider):
             logger.error(f"Error selecting folder {folder}: {e}")
             return False
 
-    def _normalize_folder_name(self, imap_folder: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _normalize_folder_name(imap_folder: str) -> str:
         """
         Normalize IMAP folder name to logical folder name.
 
+        Called for every parsed message with only a handful of distinct
+        folders, so results are cached.
+
         Maps common IMAP folder names to standard logical names:
         - INBOX -> inbox
         - Sent/Sent Items/Sent Mail/INBOX.Sent -> sent
@@ -404,6 +457,7 @@ class IMAPProvider(BaseEmailProvider):
         self,
         since: Optional[datetime] = None,
         max_results: int = 100,
+        known_ids: Optional[Set[str]] = None,
         folder: Optional[str] = None,
     ) -> List[Message]:
         """
@@ -412,6 +466,8 @@ class IMAPProvider(BaseEmailProvider):
         Args:
             since: Only fetch messages after this date
             max_results: Maximum number of messages to fetch
+            known_ids: Message IDs already stored locally; matching UIDs are
+                not downloaded again
             folder: Folder to fetch from. If None, fetches from all common folders (INBOX, Sent, Trash)
 
         Returns:
@@ -422,7 +478,7 @@ class IMAPProvider(BaseEmailProvider):
 
         # If specific folder requested, fetch from that folder only
         if folder:
-            return self._fetch_from_folder(folder, since, max_results)
+            return self._fetch_from_folder(folder, since, max_results, known_ids)
 
         # Otherwise, fetch from multiple common folders (like Gmail's "in:all")
         logger.info("Fetching messages from all folders (INBOX, Sent, Trash)")
@@ -447,14 +503,34 @@ class IMAPProvider(BaseEmailProvider):
         all_messages = []
         per_folder_limit = max(10, max_results // len(folders_to_fetch)) if folders_to_fetch else max_results
 
-        for folder_name in folders_to_fetch:
+        def fetch(folder_name: str, pooled: bool) -> List[Message]:
             try:
-                messages = self._fetch_from_folder(folder_name, since, per_folder_limit)
-                all_messages.extend(messages)
+                if pooled:
+                    messages = self._fetch_from_folder_pooled(
+                        folder_name, since, per_folder_limit, known_ids
+                    )
+                else:
+                    messages = self._fetch_from_folder(
+                        folder_name, since, per_folder_limit, known_ids
+                    )
                 logger.info(f"Fetched {len(messages)} messages from {folder_name}")
+                return messages
             except Exception as e:
                 logger.error(f"Failed to fetch from folder {folder_name}: {e}")
-                continue
+                return []
+
+        # The first folder is fetched on this provider's connection while the
+        # rest run on connections borrowed from the pool, overlapping their I/O
+        workers = min(self.config.folder_fetch_connections - 1, len(folders_to_fetch) - 1)
+        if workers > 0:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="imap-fetch") as pool:
+                futures = [pool.submit(fetch, name, True) for name in folders_to_fetch[1:]]
+                all_messages.extend(fetch(folders_to_fetch[0], False))
+                for future in futures:
+                    all_messages.extend(future.result())
+        else:
+            for folder_name in folders_to_fetch:
+                all_messages.extend(fetch(folder_name, False))
 
         # Sort by date (most recent first) and limit total results
         all_messages.sort(key=lambda m: m.date, reverse=True)
@@ -464,11 +540,46 @@ class IMAPProvider(BaseEmailProvider):
         logger.info(f"Total fetched: {len(all_messages)} messages across {len(folders_to_fetch)} folders")
         return all_messages
 
+    def _fetch_from_folder_pooled(
+        self,
+        folder: str,
+        since: Optional[datetime] = None,
+        max_results: int = 100,
+        known_ids: Optional[Set[str]] = None,
+    ) -> List[Message]:
+        """
+        Fetch messages from a folder on a connection borrowed from the pool.
+
+        Used from worker threads, which can't share this provider's connection.
+
+        Args:
+            folder: IMAP folder name
+            since: Only fetch messages after this date
+            max_results: Maximum number of messages to fetch
+            known_ids: Message IDs already stored locally
+
+        Returns:
+            List of normalized Message objects
+        """
+        pool = get_connection_pool()
+        connection = pool.get_connection(
+            account_id=self.config.account_id,
+            create_fn=self.create_connection,
+        )
+        try:
+            return self._fetch_from_folder(
+                folder, since, max_results, known_ids, connection=connection
+            )
+        finally:
+            pool.release_connection(self.config.account_id, connection)
+
     def _fetch_from_folder(
         self,
         folder: str,
         since: Optional[datetime] = None,
         max_results: int = 100,
+        known_ids: Optional[Set[str]] = None,
+        connection: Optional[imaplib.IMAP4] = None,
     ) -> List[Message]:
         """
         Fetch messages from a specific IMAP folder.
@@ -477,14 +588,25 @@ class IMAPProvider(BaseEmailProvider):
             folder: IMAP folder name
             since: Only fetch messages after this date
             max_results: Maximum number of messages to fetch
+            known_ids: Message IDs already stored locally; their UIDs are
+                not fetched again
+            connection: Connection to fetch on instead of this provider's own;
+                the folder is selected on it without touching _current_folder
 
         Returns:
             List of normalized Message objects
         """
         # Select the folder
-        if not self._select_folder(folder):
-            logger.error(f"Failed to select folder {folder}, skipping fetch")
-            return []
+        if connection is None:
+            if not self._select_folder(folder):
+                logger.error(f"Failed to select folder {folder}, skipping fetch")
+                return []
+            connection = self.connection
+        else:
+            typ, _ = connection.select(folder)
+            if typ != "OK":
+                logger.error(f"Failed to select folder {folder}, skipping fetch")
+                return []
 
         logger.debug(f"Fetching messages from IMAP folder '{folder}' (max: {max_results})")
 
@@ -497,47 +619,142 @@ class IMAPProvider(BaseEmailProvider):
             search_criteria = "ALL"
 
         # Search for message UIDs (use UID SEARCH to get stable UIDs, not sequence numbers)
-        typ, msg_ids_data = self.connection.uid("SEARCH", None, search_criteria)
-        if typ != "OK":
-            logger.error("IMAP UID SEARCH failed")
-            return []
+        msg_ids = None
+        if self._supports_esearch:
+            msg_ids = self._esearch_uids(connection, search_criteria, max_results)
 
-        msg_ids = msg_ids_data[0].split()
+        if msg_ids is None:
+            typ, msg_ids_data = connection.uid("SEARCH", None, search_criteria)
+            if typ != "OK":
+                logger.error("IMAP UID SEARCH failed")
+                return []
 
-        # Limit results (take most recent)
-        if len(msg_ids) > max_results:
-            msg_ids = msg_ids[-max_results:]
+            msg_ids = msg_ids_data[0].split()
+
+            # Limit results (take most recent)
+            if len(msg_ids) > max_results:
+                msg_ids = msg_ids[-max_results:]
 
         logger.debug(f"Found {len(msg_ids)} messages in {folder}")
 
+        # Skip messages we already have; IDs are account_id:folder:uid
+        if known_ids:
+            id_prefix = f"{self.config.account_id}:{folder}:"
+            found = len(msg_ids)
+            msg_ids = [uid for uid in msg_ids if id_prefix + uid.decode() not in known_ids]
+            logger.debug(f"Skipping {found - len(msg_ids)} already stored messages in {folder}")
+
+        # Normalize folder name to logical name, once for the whole folder
+        logical_folder = self._normalize_folder_name(folder)
+
         messages = []
-        for msg_id in msg_ids:
-            try:
-                # Fetch message using UID (RFC822 = full message, FLAGS = keywords/flags)
-                typ, msg_data = self.connection.uid("FETCH", msg_id, "(RFC822 FLAGS)")
+        batch_size = self.config.fetch_batch_size
+        for start in range(0, len(msg_ids), batch_size):
+            chunk = msg_ids[start : start + batch_size]
 
-                if typ != "OK" or not msg_data or not msg_data[0]:
-                    logger.warning(f"Failed to fetch message {msg_id}")
+            # Fetch the whole chunk in one round-trip using UIDs (BODY.PEEK[] =
+            # full message without setting \Seen, FLAGS = keywords/flags)
+            typ, msg_data = connection.uid("FETCH", b",".join(chunk), "(BODY.PEEK[] FLAGS)")
+
+            if typ != "OK" or not msg_data:
+                logger.warning(f"Failed to fetch {len(chunk)} messages from {folder}")
+                continue
+
+            for meta, raw_email in self._iter_fetch_responses(msg_data):
+                uid_match = _UID_RE.search(meta)
+                if not uid_match:
+                    logger.warning(f"FETCH response without UID: {meta[:80]!r}")
                     continue
+                msg_id = uid_match.group(1).decode()
 
-                # Parse message data
-                raw_email = msg_data[0][1]
-                email_message = email.message_from_bytes(raw_email)
+                try:
+                    # Parse message data
+                    email_message = _BYTES_PARSER.parsebytes(raw_email)
 
-                # Extract flags from response
-                flags_str = msg_data[0][0].decode("utf-8", errors="ignore")
-                flags = self._parse_flags(flags_str)
+                    # Extract flags from response
+                    flags = self._parse_flags(meta.decode("utf-8", errors="ignore"))
 
-                # Parse into normalized Message object
-                message = self._parse_message(msg_id.decode(), email_message, flags, folder)
-                messages.append(message)
+                    # Parse into normalized Message object
+                    message = self._parse_message(
+                        msg_id, email_message, flags, folder, logical_folder
+                    )
+                    messages.append(message)
 
-            except Exception as e:
-                logger.error(f"Error parsing message {msg_id}: {e}")
-                continue
+                except Exception as e:
+                    logger.error(f"Error parsing message {msg_id}: {e}")
+                    continue
 
         return messages
 
+    @staticmethod
+    def _esearch_uids(
+        connection: imaplib.IMAP4, search_criteria: str, max_results: int
+    ) -> Optional[List[bytes]]:
+        """
+        Search with ESEARCH (RFC 4731) and return the newest matching UIDs.
+
+        The server answers with a compact UID set such as "1:50,100:150"
+        instead of every UID, and only the last max_results are expanded.
+
+        Args:
+            connection: Connection with the folder selected
+            search_criteria: IMAP search criteria
+            max_results: Maximum number of UIDs to return
+
+        Returns:
+            Up to max_results UIDs in ascending order, or None if the
+            search failed and a plain SEARCH should be used instead
+        """
+        try:
+            typ, _ = connection.uid("SEARCH", "RETURN (ALL)", search_criteria)
+            _, data = connection.response("ESEARCH")
+        except imaplib.IMAP4.error as e:
+            logger.warning(f"IMAP ESEARCH failed, falling back to SEARCH: {e}")
+            return None
+        if typ != "OK":
+            return None
+
+        # No ALL item means no matches
+        match = _ESEARCH_ALL_RE.search(data[-1] or b"") if data else None
+        if not match:
+            return []
+
+        uids: List[bytes] = []
+        for uid_range in reversed(match.group(1).split(b",")):
+            first, _, last = uid_range.partition(b":")
+            low, high = sorted((int(first), int(last or first)))
+            stop = max(low, high - (max_results - len(uids)) + 1)
+            uids.extend(str(uid).encode() for uid in range(high, stop - 1, -1))
+            if len(uids) >= max_results:
+                break
+        uids.reverse()
+        return uids
+
+    @staticmethod
+    def _iter_fetch_responses(msg_data: list) -> Iterator[Tuple[bytes, bytes]]:
+        """Split a multi-message FETCH response into per-message parts.
+
+        imaplib returns each message as a (prefix, literal) tuple followed
+        by a bytes item holding whatever the server sent after the literal,
+        e.g. b")" or b" FLAGS (\\Seen))". Unsolicited untagged responses
+        may be mixed in as plain bytes items.
+
+        Args:
+            msg_data: Data list returned by a UID FETCH command
+
+        Yields:
+            (metadata, literal) per message, where metadata joins the
+            text before and after the literal
+        """
+        for i, item in enumerate(msg_data):
+            if not isinstance(item, tuple):
+                continue
+            meta, literal = item
+            trailer = msg_data[i + 1] if i + 1 < len(msg_data) else b""
+            if isinstance(trailer, bytes):
+                meta += trailer
+            yield meta, literal
+
     def mark_as_read(self, message_id: str) -> None:
         """
         Mark a message as read by setting the \Seen flag.
@@ -725,6 +942,19 @@ class IMAPProvider(BaseEmailProvider):
             add_labels: Labels to add
             remove_labels: Labels to remove
         """
+        self.batch_update_labels([message_id], add_labels, remove_labels)
+
+    def batch_update_labels(
+        self, message_ids: List[str], add_labels: Set[str], remove_labels: Set[str]
+    ) -> None:
+        """
+        Update IMAP keywords for several messages with one STORE per folder.
+
+        Args:
+            message_ids: Message IDs (format: account_id:folder:uid)
+            add_labels: Labels to add
+            remove_labels: Labels to remove
+        """
         if not self._supports_keywords:
             logger.debug(
                 "IMAP KEYWORD extension not supported - running in read-only mode"
@@ -734,33 +964,41 @@ class IMAPProvider(BaseEmailProvider):
         if not self.connection:
             raise RuntimeError("Not authenticated")
 
-        # Parse message ID to extract folder and UID
-        folder, uid = self._parse_message_id(message_id)
+        # STORE takes a UID set within the selected folder, so group by folder
+        uids_by_folder: Dict[str, List[str]] = {}
+        for message_id in message_ids:
+            folder, uid = self._parse_message_id(message_id)
+            uids_by_folder.setdefault(folder, []).append(uid)
 
-        try:
-            # Select the correct folder
-            if not self._select_folder(folder):
-                raise RuntimeError(f"Failed to select folder {folder}")
+        prefix = self.config.keyword_prefix
+        add_keywords = " ".join(f"{prefix}{label}" for label in add_labels)
+        remove_keywords = " ".join(f"{prefix}{label}" for label in remove_labels)
 
-            # Add keywords using UID
-            if add_labels:
-                keywords = " ".join(
-                    f"{self.config.keyword_prefix}{label}" for label in add_labels
-                )
-                self.connection.uid("STORE", uid, "+FLAGS", f"({keywords})")
-                logger.debug(f"Added keywords to message UID {uid} in {folder}: {keywords}")
+        for folder, uids in uids_by_folder.items():
+            try:
+                # Select the correct folder
+                if not self._select_folder(folder):
+                    raise RuntimeError(f"Failed to select folder {folder}")
+
+                for start in range(0, len(uids), self.STORE_BATCH_SIZE):
+                    uid_set = ",".join(uids[start : start + self.STORE_BATCH_SIZE])
+
+                    # Add keywords using UID
+                    if add_keywords:
+                        self.connection.uid("STORE", uid_set, "+FLAGS", f"({add_keywords})")
 
-            # Remove keywords using UID
-            if remove_labels:
-                keywords = " ".join(
-                    f"{self.config.keyword_prefix}{label}" for label in remove_labels
+                    # Remove keywords using UID
+                    if remove_keywords:
+                        self.connection.uid("STORE", uid_set, "-FLAGS", f"({remove_keywords})")
+
+                logger.debug(
+                    f"Updated keywords on {len(uids)} message(s) in {folder}: "
+                    f"+({add_keywords}) -({remove_keywords})"
                 )
-                self.connection.uid("STORE", uid, "-FLAGS", f"({keywords})")
-                logger.debug(f"Removed keywords from message UID {uid} in {folder}: {keywords}")
 
-        except Exception as e:
-            logger.error(f"Failed to update labels for message {uid} in {folder}: {e}")
-            raise
+            except Exception as e:
+                logger.error(f"Failed to update labels for {len(uids)} message(s) in {folder}: {e}")
+                raise
 
     def create_label(self, name: str, color: Optional[str] = None) -> str:
         """
@@ -799,7 +1037,12 @@ class IMAPProvider(BaseEmailProvider):
         return {}
 
     def _parse_message(
-        self, msg_id: str, email_message, flags: Set[str], imap_folder: str
+        self,
+        msg_id: str,
+        email_message,
+        flags: Set[str],
+        imap_folder: str,
+        logical_folder: str,
     ) -> Message:
         """
         Parse IMAP message into normalized Message object.
@@ -809,6 +1052,7 @@ class IMAPProvider(BaseEmailProvider):
             email_message: Parsed email.message object
             flags: Set of IMAP flags/keywords
             imap_folder: IMAP folder name the message was fetched from
+            logical_folder: imap_folder normalized by _normalize_folder_name
 
         Returns:
             Normalized Message object
@@ -818,8 +1062,12 @@ class IMAPProvider(BaseEmailProvider):
 
         # Get from/to
         from_email = self._decode_header(email_message.get("From", ""))
-        to_header = email_message.get("To", "")
-        to_emails = [addr.strip() for addr in to_header.split(",")]
+        # getaddresses keeps quoted display names like "Doe, John" together
+        to_emails = [
+            formataddr(pair)
+            for pair in getaddresses(email_message.get_all("To", []))
+            if pair[1]
+        ]
 
         # Get date - convert to local time for correct display
         # (JS interprets naive datetime strings as local time)
@@ -843,19 +1091,14 @@ class IMAPProvider(BaseEmailProvider):
         # Check unread status (\Seen flag)
         is_unread = "\\Seen" not in flags
 
-        # Extract keywords (AI tags)
-        keywords = [
-            f.replace(self.config.keyword_prefix, "")
-            for f in flags
-            if f.startswith(self.config.keyword_prefix)
-        ]
+        # Extract keywords (AI tags), interned so every message shares one
+        # copy of each tag name
+        prefix = self.config.keyword_prefix
+        keywords = [sys.intern(f[len(prefix) :]) for f in flags if f.startswith(prefix)]
 
         # Get thread ID from Message-ID header
         thread_id = email_message.get("Message-ID", f"thread-{msg_id}")
 
-        # Normalize folder name to logical name
-        logical_folder = self._normalize_folder_name(imap_folder)
-
         return Message(
             id=f"{self.config.account_id}:{imap_folder}:{msg_id}",  # Include folder in message ID
             thread_id=thread_id,
@@ -866,7 +1109,7 @@ class IMAPProvider(BaseEmailProvider):
             snippet=snippet,
             body_text=body_text,
             body_html=body_html,
-            labels=keywords,
+            labels=frozenset(keywords),
             is_unread=is_unread,
             folder=logical_folder,
             imap_folder=imap_folder,  # Store actual IMAP folder name
@@ -886,7 +1129,44 @@ class IMAPProvider(BaseEmailProvider):
         if not header:
             return ""
 
-        decoded_parts = decode_header(header)
+        if isinstance(header, str):
+            # Most headers carry no encoded words; decode_header would return
+            # them unchanged anyway
+            if "=?" not in header:
+                return header.strip()
+            return self._decode_encoded_header(header)
+
+        # compat32 Header objects (raw 8-bit headers) aren't hashable
+        return self._join_decoded_parts(decode_header(header))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _decode_encoded_header(header: str) -> str:
+        """
+        Decode a header string containing RFC 2047 encoded words.
+
+        Cached because newsletters and mailing lists repeat the same encoded
+        subjects and senders across a mailbox.
+
+        Args:
+            header: Raw header string
+
+        Returns:
+            Decoded string
+        """
+        return IMAPProvider._join_decoded_parts(decode_header(header))
+
+    @staticmethod
+    def _join_decoded_parts(decoded_parts: List[tuple]) -> str:
+        """
+        Join decode_header output into one string.
+
+        Args:
+            decoded_parts: (text, charset) pairs from decode_header
+
+        Returns:
+            Decoded string
+        """
         decoded_str = ""
 
         for part, encoding in decoded_parts:
@@ -916,6 +1196,10 @@ class IMAPProvider(BaseEmailProvider):
         if email_message.is_multipart():
             # Extract from multipart message
             for part in email_message.walk():
+                # Containers carry no payload of their own
+                if part.get_content_maintype() == "multipart":
+                    continue
+
                 content_type = part.get_content_type()
                 disposition = str(part.get("Content-Disposition", ""))
 
@@ -928,15 +1212,7 @@ class IMAPProvider(BaseEmailProvider):
                     try:
                         payload = part.get_payload(decode=True)
                         if payload:
-                            # Try different encodings
-                            for encoding in ["utf-8", "iso-8859-1", "windows-1252"]:
-                                try:
-                                    body_text = payload.decode(encoding)
-                                    break
-                                except (UnicodeDecodeError, AttributeError):
-                                    continue
-                            else:
-                                body_text = payload.decode("utf-8", errors="ignore")
+                            body_text = self._decode_payload(part, payload)
                     except Exception as e:
                         logger.warning(f"Failed to decode text/plain part: {e}")
                         continue
@@ -946,33 +1222,21 @@ class IMAPProvider(BaseEmailProvider):
                     try:
                         payload = part.get_payload(decode=True)
                         if payload:
-                            # Try different encodings
-                            for encoding in ["utf-8", "iso-8859-1", "windows-1252"]:
-                                try:
-                                    body_html = payload.decode(encoding)
-                                    break
-                                except (UnicodeDecodeError, AttributeError):
-                                    continue
-                            else:
-                                body_html = payload.decode("utf-8", errors="ignore")
+                            body_html = self._decode_payload(part, payload)
                     except Exception as e:
                         logger.warning(f"Failed to decode text/html part: {e}")
                         continue
+
+                # Both bodies found; later parts can't replace them
+                if body_text and body_html:
+                    break
         else:
             # Non-multipart message
             try:
                 payload = email_message.get_payload(decode=True)
                 if payload:
                     content_type = email_message.get_content_type()
-                    # Try different encodings
-                    for encoding in ["utf-8", "iso-8859-1", "windows-1252"]:
-                        try:
-                            decoded = payload.decode(encoding)
-                            break
-                        except (UnicodeDecodeError, AttributeError):
-                            continue
-                    else:
-                        decoded = payload.decode("utf-8", errors="ignore")
+                    decoded = self._decode_payload(email_message, payload)
 
                     if content_type == "text/html":
                         body_html = decoded
@@ -983,11 +1247,31 @@ class IMAPProvider(BaseEmailProvider):
 
         # If no plain text but have HTML, create plain text version
         if not body_text and body_html:
-            # Simple HTML stripping (basic, not perfect)
-            body_text = re.sub(r"<[^>]+>", "", body_html)
+            # Simple HTML stripping (basic, not perfect): drop script/style
+            # content, then tags, then turn entities like &nbsp; into text
+            body_text = _HTML_SCRIPT_RE.sub("", body_html)
+            body_text = html.unescape(_HTML_TAG_RE.sub("", body_text))
 
         return body_text.strip() if body_text else "", body_html
 
+    @staticmethod
+    def _decode_payload(part, payload: bytes) -> str:
+        """
+        Decode a part's payload using the charset it declares.
+
+        Args:
+            part: email.message part the payload came from
+            payload: Transfer-decoded payload bytes
+
+        Returns:
+            Decoded text; UTF-8 with replacement characters if the declared
+            charset is unknown or doesn't match the bytes
+        """
+        try:
+            return payload.decode(part.get_content_charset() or "utf-8")
+        except (LookupError, UnicodeDecodeError):
+            return payload.decode("utf-8", errors="replace")
+
     def _parse_flags(self, flags_str: str) -> Set[str]:
         """
         Parse IMAP FLAGS response.
@@ -999,7 +1283,7 @@ class IMAPProvider(BaseEmailProvider):
             Set of flags/keywords
         """
         # Example: "1 (FLAGS (\\Seen $work $priority))"
-        match = re.search(r"\(FLAGS \((.*?)\)\)", flags_str)
+        match = _FLAGS_RE.search(flags_str)
         if match:
             flags_part = match.group(1)
             return set(flags_part.split())
@@ -1070,7 +1354,7 @@ class IMAPProvider(BaseEmailProvider):
         )
 
         # Parse MIME message to get From and To addresses
-        parsed_message = email.message_from_bytes(mime_message)
+        parsed_message = _BYTES_PARSER.parsebytes(mime_message)
         from_addr = parsed_message.get("From", self.config.email)
         to_addrs = []
 
@@ -1149,7 +1433,7 @@ class IMAPProvider(BaseEmailProvider):
 
             # Parse email
             raw_email = data[0][1]
-            email_message = email.message_from_bytes(raw_email)
+            email_message = _BYTES_PARSER.parsebytes(raw_email)
 
             # Extract attachments
             attachments = []
@@ -1238,7 +1522,7 @@ class IMAPProvider(BaseEmailProvider):
 
             # Parse email
             raw_email = data[0][1]
-            email_message = email.message_from_bytes(raw_email)
+            email_message = _BYTES_PARSER.parsebytes(raw_email)
 
             # Extract attachment by index
             attachment_index = int(attachment_id.split("_")[1])
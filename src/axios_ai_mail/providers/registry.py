@@ -1,5 +1,6 @@
 """Provider registry for dynamic loading."""
 
+import importlib
 import logging
 from typing import Dict, Type
 
@@ -12,6 +13,7 @@ class ProviderRegistry:
     """Registry for email provider implementations."""
 
     _providers: Dict[str, Type[BaseEmailProvider]] = {}
+    _lazy_providers: Dict[str, str] = {}
 
     @classmethod
     def register(cls, provider_type: str, provider_class: Type[BaseEmailProvider]) -> None:
@@ -22,8 +24,40 @@ class ProviderRegistry:
             provider_class: Provider class to register
         """
         cls._providers[provider_type] = provider_class
+        cls._lazy_providers.pop(provider_type, None)
         logger.debug(f"Registered provider: {provider_type} -> {provider_class.__name__}")
 
+    @classmethod
+    def register_lazy(cls, provider_type: str, import_path: str) -> None:
+        """Register a provider implementation without importing it yet.
+
+        The module is imported the first time the provider is requested, so
+        processes that never use a provider don't pay for its dependencies
+        (e.g. the Google API client for Gmail).
+
+        Args:
+            provider_type: Provider type identifier (e.g., "gmail", "imap")
+            import_path: Provider class location as "package.module:ClassName"
+        """
+        if provider_type not in cls._providers:
+            cls._lazy_providers[provider_type] = import_path
+            logger.debug(f"Registered lazy provider: {provider_type} -> {import_path}")
+
+    @classmethod
+    def _load_lazy(cls, provider_type: str) -> None:
+        """Import and register a lazily registered provider.
+
+        Args:
+            provider_type: Provider type identifier
+        """
+        import_path = cls._lazy_providers.get(provider_type)
+        if import_path is None:
+            return
+
+        module_name, class_name = import_path.split(":", 1)
+        module = importlib.import_module(module_name)
+        cls.register(provider_type, getattr(module, class_name))
+
     @classmethod
     def get_provider(cls, provider_type: str, config: ProviderConfig) -> BaseEmailProvider:
         """Get a provider instance by type.
@@ -38,6 +72,9 @@ class ProviderRegistry:
         Raises:
             ValueError: If provider type is not registered
         """
+        if provider_type not in cls._providers:
+            cls._load_lazy(provider_type)
+
         if provider_type not in cls._providers:
             available = ", ".join(cls._providers.keys())
             raise ValueError(
@@ -51,7 +88,11 @@ class ProviderRegistry:
     def list_providers(cls) -> Dict[str, Type[BaseEmailProvider]]:
         """List all registered providers.
 
+        Lazily registered providers are imported so their classes can be returned.
+
         Returns:
             Dict mapping provider type to provider class
         """
+        for provider_type in list(cls._lazy_providers):
+            cls._load_lazy(provider_type)
         return cls._providers.copy()
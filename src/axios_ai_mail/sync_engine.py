@@ -2,8 +2,8 @@
 
 import logging
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import List, Optional, Set
+from datetime import datetime, timedelta, timezone
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 from .action_agent import ActionAgent
 from .ai_classifier import AIClassifier, AIConfig
@@ -13,6 +13,10 @@ from .providers.base import BaseEmailProvider, Message
 
 logger = logging.getLogger(__name__)
 
+# Providers re-list from the day of the last sync, and message dates are local
+# time while last_sync is UTC, so look this far back for already-stored messages
+KNOWN_MESSAGE_WINDOW_MARGIN = timedelta(days=2)
+
 
 @dataclass
 class NewMessageInfo:
@@ -147,7 +151,15 @@ class SyncEngine:
             last_sync = self.db.get_last_sync_time(self.account_id)
             logger.info(f"Last sync: {last_sync}")
 
-            messages = self.provider.fetch_messages(since=last_sync, max_results=max_messages)
+            # Messages already stored and classified in the re-listed window
+            # don't need their bodies downloaded again
+            known_ids = self.db.get_classified_message_ids(
+                self.account_id,
+                since=last_sync - KNOWN_MESSAGE_WINDOW_MARGIN if last_sync else None,
+            )
+            messages = self.provider.fetch_messages(
+                since=last_sync, max_results=max_messages, known_ids=known_ids
+            )
             messages_fetched = len(messages)
 
             if not messages:
@@ -204,6 +216,7 @@ class SyncEngine:
 
             # 5. Classify unclassified messages
             to_classify = [msg for msg in messages if not self.db.has_classification(msg.id)]
+            label_changes: Dict[Tuple[FrozenSet[str], FrozenSet[str]], List[str]] = {}
             logger.info(f"Classifying {len(to_classify)} messages")
 
             for message in to_classify:
@@ -215,7 +228,7 @@ class SyncEngine:
                     # Store classification in database
                     self.db.store_classification(
                         message_id=message.id,
-                        tags=classification.tags,
+                        tags=list(classification.tags),
                         priority=classification.priority,
                         todo=classification.todo,
                         can_archive=classification.can_archive,
@@ -225,26 +238,9 @@ class SyncEngine:
 
                     messages_classified += 1
 
-                    # 6. Push labels to provider
+                    # Queue label changes for the provider
                     try:
-                        add_labels, remove_labels = self._compute_label_changes(
-                            message, classification
-                        )
-
-                        if add_labels or remove_labels:
-                            # Ensure labels exist
-                            self.provider.ensure_labels_exist(add_labels)
-
-                            # Update labels on provider
-                            self.provider.update_labels(
-                                message.id, add_labels=add_labels, remove_labels=remove_labels
-                            )
-
-                            labels_updated += 1
-                            logger.debug(
-                                f"Updated labels for {message.id}: +{add_labels} -{remove_labels}"
-                            )
-
+                        self._queue_label_changes(message, classification, label_changes)
                     except Exception as e:
                         error_msg = f"Failed to update labels for {message.id}: {e}"
                         logger.error(error_msg)
@@ -255,6 +251,9 @@ class SyncEngine:
                     logger.error(error_msg)
                     errors.append(error_msg)
 
+            # Push labels to provider, one bulk update per distinct change
+            labels_updated += self._push_label_changes(label_changes, errors)
+
             # 6. Process action tags (if action agent is configured)
             if self.action_agent:
                 try:
@@ -324,6 +323,60 @@ class SyncEngine:
                 actions_failed=actions_failed,
             )
 
+    def _queue_label_changes(
+        self,
+        message: Message,
+        classification,
+        label_changes: Dict[Tuple[FrozenSet[str], FrozenSet[str]], List[str]],
+    ) -> None:
+        """Group a message under its (labels_to_add, labels_to_remove) change.
+
+        Args:
+            message: Message being classified
+            classification: AI classification result
+            label_changes: Message IDs by label change, updated in place
+        """
+        add_labels, remove_labels = self._compute_label_changes(message, classification)
+        if add_labels or remove_labels:
+            key = (frozenset(add_labels), frozenset(remove_labels))
+            label_changes.setdefault(key, []).append(message.id)
+
+    def _push_label_changes(
+        self,
+        label_changes: Dict[Tuple[FrozenSet[str], FrozenSet[str]], List[str]],
+        errors: List[str],
+    ) -> int:
+        """Apply grouped label changes with one bulk provider call per group.
+
+        Args:
+            label_changes: Message IDs by (labels_to_add, labels_to_remove)
+            errors: Error list to append failures to
+
+        Returns:
+            Number of messages whose labels were updated
+        """
+        updated = 0
+        for (add_labels, remove_labels), message_ids in label_changes.items():
+            try:
+                # Ensure labels exist
+                self.provider.ensure_labels_exist(set(add_labels))
+
+                self.provider.batch_update_labels(
+                    message_ids, add_labels=set(add_labels), remove_labels=set(remove_labels)
+                )
+
+                updated += len(message_ids)
+                logger.debug(
+                    f"Updated labels for {len(message_ids)} message(s): "
+                    f"+{set(add_labels)} -{set(remove_labels)}"
+                )
+
+            except Exception as e:
+                error_msg = f"Failed to update labels for {', '.join(message_ids)}: {e}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+        return updated
+
     def _compute_label_changes(
         self, message: Message, classification
     ) -> tuple[Set[str], Set[str]]:
@@ -464,6 +517,7 @@ class SyncEngine:
             # Get all messages for this account
             messages = self.db.query_messages(account_id=self.account_id, limit=max_messages or 10000)
             logger.info(f"Reclassifying {len(messages)} messages")
+            label_changes: Dict[Tuple[FrozenSet[str], FrozenSet[str]], List[str]] = {}
 
             for db_message in messages:
                 try:
@@ -478,7 +532,7 @@ class SyncEngine:
                         snippet=db_message.snippet,
                         body_text=db_message.body_text,
                         body_html=db_message.body_html,
-                        labels=set(db_message.provider_labels),
+                        labels=frozenset(db_message.provider_labels),
                         is_unread=db_message.is_unread,
                         folder=db_message.folder,
                     )
@@ -491,7 +545,7 @@ class SyncEngine:
                     # Store classification (preserve action tags)
                     self.db.store_classification(
                         message_id=message.id,
-                        tags=classification.tags,
+                        tags=list(classification.tags),
                         priority=classification.priority,
                         todo=classification.todo,
                         can_archive=classification.can_archive,
@@ -502,19 +556,9 @@ class SyncEngine:
 
                     messages_classified += 1
 
-                    # Update labels on provider
+                    # Queue label changes for the provider
                     try:
-                        add_labels, remove_labels = self._compute_label_changes(
-                            message, classification
-                        )
-
-                        if add_labels or remove_labels:
-                            self.provider.ensure_labels_exist(add_labels)
-                            self.provider.update_labels(
-                                message.id, add_labels=add_labels, remove_labels=remove_labels
-                            )
-                            labels_updated += 1
-
+                        self._queue_label_changes(message, classification, label_changes)
                     except Exception as e:
                         error_msg = f"Failed to update labels for {message.id}: {e}"
                         logger.error(error_msg)
@@ -525,6 +569,9 @@ class SyncEngine:
                     logger.error(error_msg)
                     errors.append(error_msg)
 
+            # Update labels on provider, one bulk update per distinct change
+            labels_updated += self._push_label_changes(label_changes, errors)
+
             duration = (datetime.now(timezone.utc) - start_time).total_seconds()
             result = SyncResult(
                 account_id=self.account_id,
@@ -197,7 +197,7 @@ class TestConfidenceParsing:
             result = classifier.classify(sample_message)
 
         assert result.confidence == 0.5
-        assert result.tags == ["personal"]  # Default fallback
+        assert result.tags == ("personal",)  # Default fallback
 
 
 class TestTagNormalization:
@@ -306,7 +306,7 @@ class TestClassificationResult:
             result = classifier.classify(sample_message)
 
         assert isinstance(result, Classification)
-        assert result.tags == ["work", "dev"]
+        assert result.tags == ("work", "dev")
         assert result.priority == "high"
         assert result.todo is True
         assert result.can_archive is False
@@ -0,0 +1 @@
+# MCP tests package
@@ -0,0 +1,73 @@
+"""Tests for MCP tool helpers."""
+
+from typing import Any
+
+import pytest
+
+from axios_ai_mail.mcp.client import APIError
+from axios_ai_mail.mcp.tools import BULK_CHUNK_SIZE, _bulk_request
+
+
+class TestBulkRequest:
+    """Tests for chunked bulk API calls."""
+
+    @pytest.mark.asyncio
+    async def test_single_chunk_passes_result_through(self) -> None:
+        """Small batches are sent as one request and returned unchanged."""
+        calls: list[list[str]] = []
+
+        async def call(ids: list[str]) -> dict[str, Any]:
+            calls.append(ids)
+            return {"updated": len(ids), "total": len(ids), "errors": []}
+
+        result = await _bulk_request(call, ["a", "b"])
+
+        assert calls == [["a", "b"]]
+        assert result == {"updated": 2, "total": 2, "errors": []}
+
+    @pytest.mark.asyncio
+    async def test_large_batch_is_chunked_and_merged(self) -> None:
+        """Large batches are split and per-chunk counts summed."""
+        ids = [f"m{i}" for i in range(BULK_CHUNK_SIZE * 2 + 5)]
+        chunk_sizes: list[int] = []
+
+        async def call(chunk: list[str]) -> dict[str, Any]:
+            chunk_sizes.append(len(chunk))
+            return {
+                "updated": len(chunk) - 1,
+                "total": len(chunk),
+                "errors": [{"message_id": chunk[0], "error": "Not found"}],
+            }
+
+        result = await _bulk_request(call, ids)
+
+        assert sorted(chunk_sizes) == [5, BULK_CHUNK_SIZE, BULK_CHUNK_SIZE]
+        assert result["updated"] == len(ids) - 3
+        assert result["total"] == len(ids)
+        assert len(result["errors"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_reported_per_message(self) -> None:
+        """A failing chunk turns into one error entry per message ID."""
+        ids = [f"m{i}" for i in range(BULK_CHUNK_SIZE + 1)]
+
+        async def call(chunk: list[str]) -> dict[str, Any]:
+            if len(chunk) == 1:
+                raise APIError("API error: boom", status_code=500)
+            return {"updated": len(chunk), "total": len(chunk), "errors": []}
+
+        result = await _bulk_request(call, ids)
+
+        assert result["updated"] == BULK_CHUNK_SIZE
+        assert result["errors"] == [{"message_id": ids[-1], "error": "API error: boom"}]
+
+    @pytest.mark.asyncio
+    async def test_all_chunks_failing_raises(self) -> None:
+        """If nothing succeeded the original error propagates."""
+        ids = [f"m{i}" for i in range(BULK_CHUNK_SIZE + 1)]
+
+        async def call(chunk: list[str]) -> dict[str, Any]:
+            raise APIError("API error: down", status_code=503)
+
+        with pytest.raises(APIError):
+            await _bulk_request(call, ids)
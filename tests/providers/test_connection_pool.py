@@ -0,0 +1,287 @@
+"""Tests for the IMAP connection pool."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from axios_ai_mail.providers.connection_pool import AsyncIMAPConnectionPool, IMAPConnectionPool
+
+
+class FakeConnection:
+    """Minimal stand-in for an imaplib connection."""
+
+    def __init__(self) -> None:
+        self.noops = 0
+        self.logged_out = False
+
+    def noop(self):
+        self.noops += 1
+        return "OK", [b""]
+
+    def logout(self) -> None:
+        self.logged_out = True
+
+    def close(self) -> None:
+        pass
+
+
+class TestIMAPConnectionPool:
+    """Tests for connection reuse and hand-off."""
+
+    def test_released_connection_is_reused(self) -> None:
+        """An idle connection is handed out again instead of reconnecting."""
+        pool = IMAPConnectionPool()
+        first = pool.get_connection("acct", FakeConnection)
+        pool.release_connection("acct", first)
+
+        second = pool.get_connection("acct", FakeConnection)
+
+        assert second is first
+        assert pool.get_stats()["in_use"] == 1
+
+    def test_recently_verified_connection_skips_noop(self) -> None:
+        """Reuse within the health check threshold doesn't NOOP the server."""
+        pool = IMAPConnectionPool(health_check_threshold=60)
+        conn = pool.get_connection("acct", FakeConnection)
+        pool.release_connection("acct", conn)
+
+        pool.get_connection("acct", FakeConnection)
+
+        assert conn.noops == 0
+
+    def test_release_hands_off_to_waiting_caller(self) -> None:
+        """A caller blocked on a busy connection receives it on release."""
+        pool = IMAPConnectionPool(hand_off_timeout=5, max_per_account=1)
+        conn = pool.get_connection("acct", FakeConnection)
+        received = []
+
+        waiter = threading.Thread(
+            target=lambda: received.append(pool.get_connection("acct", FakeConnection))
+        )
+        waiter.start()
+        deadline = time.monotonic() + 5
+        while not pool._waiters and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool._waiters
+        pool.release_connection("acct", conn)
+        waiter.join(timeout=5)
+
+        assert received == [conn]
+        assert pool.get_stats()["in_use"] == 1
+
+    def test_busy_account_gets_second_pooled_connection(self) -> None:
+        """A concurrent caller opens another pooled connection up to the limit."""
+        pool = IMAPConnectionPool(max_per_account=2)
+        first = pool.get_connection("acct", FakeConnection)
+
+        second = pool.get_connection("acct", FakeConnection)
+
+        assert second is not first
+        assert pool.get_stats()["total_connections"] == 2
+
+    def test_unpooled_connection_is_logged_out_on_release(self) -> None:
+        """Connections opened past the limit are closed rather than leaked."""
+        pool = IMAPConnectionPool(hand_off_timeout=0, max_per_account=1)
+        pooled = pool.get_connection("acct", FakeConnection)
+        overflow = pool.get_connection("acct", FakeConnection)
+
+        pool.release_connection("acct", overflow)
+
+        assert overflow.logged_out
+        assert not pooled.logged_out
+        assert pool.get_stats()["total_connections"] == 1
+
+    def test_dropping_unhealthy_connection_wakes_waiters(self) -> None:
+        """Callers queued during a failing health check don't wait out the timeout."""
+        noop_started = threading.Event()
+        finish_noop = threading.Event()
+
+        class FlakyConnection(FakeConnection):
+            def noop(self):
+                noop_started.set()
+                finish_noop.wait(5)
+                return "NO", [b""]
+
+        pool = IMAPConnectionPool(health_check_threshold=-1, hand_off_timeout=30, max_per_account=1)
+        stale = pool.get_connection("acct", FlakyConnection)
+        pool.release_connection("acct", stale)
+
+        checker = threading.Thread(target=pool.get_connection, args=("acct", FakeConnection))
+        checker.start()
+        assert noop_started.wait(5)
+        received = []
+        waiter = threading.Thread(
+            target=lambda: received.append(pool.get_connection("acct", FakeConnection))
+        )
+        waiter.start()
+        deadline = time.monotonic() + 5
+        while not pool._waiters and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool._waiters
+
+        started = time.monotonic()
+        finish_noop.set()
+        waiter.join(timeout=5)
+        checker.join(timeout=5)
+
+        assert time.monotonic() - started < 5
+        assert received and received[0] is not stale
+        assert stale.logged_out
+
+    def test_keepalive_hands_off_to_caller_queued_during_noop(self) -> None:
+        """A caller arriving mid keep-alive gets the pinged connection, not a new one."""
+        noop_started = threading.Event()
+        finish_noop = threading.Event()
+
+        class SlowConnection(FakeConnection):
+            def noop(self):
+                noop_started.set()
+                finish_noop.wait(5)
+                return super().noop()
+
+        pool = IMAPConnectionPool(keepalive_interval=None, hand_off_timeout=30, max_per_account=1)
+        conn = pool.get_connection("acct", SlowConnection)
+        pool.release_connection("acct", conn)
+        pool._keepalive_interval = 0
+
+        pinger = threading.Thread(target=pool.send_keepalives)
+        pinger.start()
+        assert noop_started.wait(5)
+        received = []
+        waiter = threading.Thread(
+            target=lambda: received.append(pool.get_connection("acct", FakeConnection))
+        )
+        waiter.start()
+        deadline = time.monotonic() + 5
+        while not pool._waiters and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool._waiters
+
+        finish_noop.set()
+        waiter.join(timeout=5)
+        pinger.join(timeout=5)
+
+        assert received == [conn]
+        assert pool.get_stats()["total_connections"] == 1
+        assert pool.get_stats()["in_use"] == 1
+
+    def test_most_recently_released_connection_is_reused_first(self) -> None:
+        """LIFO reuse keeps the hot connection hot and lets cold ones idle out."""
+        pool = IMAPConnectionPool(keepalive_interval=None, max_per_account=2)
+        first = pool.get_connection("acct", FakeConnection)
+        second = pool.get_connection("acct", FakeConnection)
+        pool.release_connection("acct", second)
+        pool.release_connection("acct", first)
+
+        assert pool.get_connection("acct", FakeConnection) is first
+
+    def test_full_pool_evicts_least_recently_released_idle_connection(self) -> None:
+        """Creating past max_total closes the coldest idle connection."""
+        pool = IMAPConnectionPool(keepalive_interval=None, max_total=2)
+        cold = pool.get_connection("a", FakeConnection)
+        warm = pool.get_connection("b", FakeConnection)
+        pool.release_connection("a", cold)
+        pool.release_connection("b", warm)
+
+        pool.get_connection("c", FakeConnection)
+
+        assert cold.logged_out
+        assert not warm.logged_out
+        assert sorted(pool.get_stats()["accounts"]) == ["b", "c"]
+
+    def test_stats_track_checkouts_across_release_and_discard(self) -> None:
+        """The running in-use count matches the connections actually checked out."""
+
+        class DeadConnection(FakeConnection):
+            def noop(self):
+                return "NO", [b""]
+
+        pool = IMAPConnectionPool(keepalive_interval=None, health_check_threshold=-1)
+        dead = pool.get_connection("a", DeadConnection)
+        live = pool.get_connection("b", FakeConnection)
+        pool.release_connection("a", dead)
+        assert pool.get_stats()["in_use"] == 1
+
+        pool.get_connection("a", FakeConnection)
+        pool.release_connection("b", live)
+
+        stats = pool.get_stats()
+        assert stats["total_connections"] == 2
+        assert stats["in_use"] == 1
+        assert stats["idle"] == 1
+
+
+class TestAsyncIMAPConnectionPool:
+    """Tests for the asyncio front end."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_hand_off_without_blocking_loop(self) -> None:
+        """A coroutine waiting on a busy connection leaves the loop free."""
+        pool = IMAPConnectionPool(keepalive_interval=None, hand_off_timeout=5, max_per_account=1)
+        async_pool = AsyncIMAPConnectionPool(pool)
+        conn = await async_pool.get_connection("acct", FakeConnection)
+
+        async def release_later() -> None:
+            await asyncio.sleep(0.1)
+            async_pool.release_connection("acct", conn)
+
+        releaser = asyncio.create_task(release_later())
+        received = await async_pool.get_connection("acct", FakeConnection)
+        await releaser
+
+        assert received is conn
+
+    @pytest.mark.asyncio
+    async def test_unpooled_connection_is_closed_off_loop(self) -> None:
+        """Releasing an overflow connection logs it out in a worker thread."""
+        pool = IMAPConnectionPool(keepalive_interval=None, hand_off_timeout=0, max_per_account=1)
+        async_pool = AsyncIMAPConnectionPool(pool)
+        await async_pool.get_connection("acct", FakeConnection)
+        overflow = await async_pool.get_connection("acct", FakeConnection)
+
+        async_pool.release_connection("acct", overflow)
+        for _ in range(100):
+            if overflow.logged_out:
+                break
+            await asyncio.sleep(0.01)
+
+        assert overflow.logged_out
+
+
+class TestFolderCacheInvalidation:
+    """Tests for invalidation callbacks."""
+
+    def test_failed_health_check_invalidates_registered_callbacks(self) -> None:
+        """Dropping a dead connection tells registered providers to forget folders."""
+
+        class DeadConnection(FakeConnection):
+            def noop(self):
+                return "NO", [b""]
+
+        pool = IMAPConnectionPool(keepalive_interval=None, health_check_threshold=-1)
+        invalidated: list[str] = []
+        pool.register_invalidation_callback("acct", invalidated.append)
+        conn = pool.get_connection("acct", DeadConnection)
+        pool.release_connection("acct", conn)
+
+        pool.get_connection("acct", FakeConnection)
+
+        assert invalidated == ["acct"]
+
+    def test_bound_method_callbacks_are_held_weakly(self) -> None:
+        """A provider registering its cache clearer can still be garbage collected."""
+
+        class Provider:
+            def clear(self, account_id: str) -> None:
+                pass
+
+        pool = IMAPConnectionPool(keepalive_interval=None)
+        provider = Provider()
+        pool.register_invalidation_callback("acct", provider.clear)
+        del provider
+
+        pool.invalidate_folder_cache("acct")
+
+        assert "acct" not in pool._invalidation_callbacks
@@ -0,0 +1,264 @@
+"""Tests for the Gmail provider."""
+
+import base64
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from unittest.mock import Mock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from axios_ai_mail.providers.implementations import gmail
+from axios_ai_mail.providers.implementations.gmail import GmailConfig, GmailProvider
+
+
+def _gmail_message(msg_id: str) -> dict:
+    """Build a minimal Gmail API message resource."""
+    return {
+        "id": msg_id,
+        "threadId": f"thread-{msg_id}",
+        "labelIds": ["INBOX"],
+        "snippet": "",
+        "internalDate": "0",
+        "payload": {"mimeType": "text/plain", "headers": [], "body": {}},
+    }
+
+
+class FakeBatch:
+    """Stand-in for googleapiclient's BatchHttpRequest."""
+
+    def __init__(self, service: Mock, callback) -> None:
+        self.service = service
+        self.callback = callback
+        self.requests: list[str] = []
+
+    def add(self, request, request_id: str) -> None:
+        self.requests.append(request_id)
+
+    def execute(self) -> None:
+        self.service.batches.append(self.requests)
+        for msg_id in self.requests:
+            if msg_id in self.service.failing:
+                status = self.service.failing[msg_id]
+                self.callback(msg_id, None, HttpError(Mock(status=status), b"error"))
+            else:
+                self.callback(msg_id, _gmail_message(msg_id), None)
+
+
+def _provider(message_ids: list[str], failing: Optional[dict] = None) -> GmailProvider:
+    """Create a provider whose service lists the given message IDs."""
+    service = Mock()
+    service.batches = []
+    service.failing = failing or {}
+    service.users().messages().list().execute.return_value = {
+        "messages": [{"id": msg_id} for msg_id in message_ids]
+    }
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(service, callback)
+    service.users().messages().get.side_effect = lambda userId, id, **params: Mock(
+        execute=Mock(return_value=_gmail_message(id))
+    )
+
+    provider = GmailProvider(
+        GmailConfig(account_id="acct", email="me@example.com", credential_file="")
+    )
+    provider.service = service
+    return provider
+
+
+class TestFetchMessages:
+    """Tests for fetching message details."""
+
+    def test_message_gets_are_batched(self) -> None:
+        """Details are fetched BATCH_SIZE messages per HTTP call, in order."""
+        message_ids = [f"m{i}" for i in range(GmailProvider.BATCH_SIZE + 5)]
+        provider = _provider(message_ids)
+
+        messages = provider.fetch_messages()
+
+        assert [m.id for m in messages] == message_ids
+        assert [len(batch) for batch in provider.service.batches] == [
+            GmailProvider.BATCH_SIZE,
+            5,
+        ]
+
+    def test_failed_message_is_skipped(self) -> None:
+        """A sub-request error drops that message without failing the fetch."""
+        provider = _provider(["m1", "m2", "m3"], failing={"m2": 404})
+
+        messages = provider.fetch_messages()
+
+        assert [m.id for m in messages] == ["m1", "m3"]
+
+    def test_rate_limited_message_is_retried_individually(self) -> None:
+        """A 429 sub-request falls back to a single get and keeps its position."""
+        provider = _provider(["m1", "m2", "m3"], failing={"m2": 429})
+
+        messages = provider.fetch_messages()
+
+        assert [m.id for m in messages] == ["m1", "m2", "m3"]
+
+    def test_known_messages_are_not_downloaded_again(self) -> None:
+        """Only listed messages missing locally are fetched in full."""
+        provider = _provider(["m1", "m2", "m3"])
+
+        messages = provider.fetch_messages(known_ids={"m1", "m3"})
+
+        assert [m.id for m in messages] == ["m2"]
+        assert provider.service.batches == [["m2"]]
+
+    def test_list_pages_are_followed_up_to_max_results(self) -> None:
+        """nextPageToken is followed until max_results IDs have been listed."""
+        provider = _provider([])
+        pages = {
+            None: {"messages": [{"id": "m1"}, {"id": "m2"}], "nextPageToken": "p2"},
+            "p2": {"messages": [{"id": "m3"}, {"id": "m4"}], "nextPageToken": "p3"},
+        }
+        requested = []
+
+        def list_page(userId, q, maxResults, pageToken=None):
+            requested.append((pageToken, maxResults))
+            return Mock(execute=Mock(return_value=pages[pageToken]))
+
+        provider.service.users().messages().list.side_effect = list_page
+
+        messages = provider.fetch_messages(max_results=3)
+
+        assert [m.id for m in messages] == ["m1", "m2", "m3"]
+        assert requested == [(None, 3), ("p2", 1)]
+
+
+class TestParseMessage:
+    """Tests for turning Gmail message resources into Messages."""
+
+    def test_nested_parts_are_walked_in_document_order(self) -> None:
+        """The first text and HTML leaves win, and deep attachments are detected."""
+
+        def leaf(mime_type: str, text: str) -> dict:
+            data = base64.urlsafe_b64encode(text.encode()).decode()
+            return {"mimeType": mime_type, "body": {"data": data}}
+
+        msg = _gmail_message("m1")
+        msg["payload"] = {
+            "mimeType": "multipart/mixed",
+            "headers": [],
+            "parts": [
+                {
+                    "mimeType": "multipart/alternative",
+                    "parts": [leaf("text/plain", "first"), leaf("text/html", "<p>first</p>")],
+                },
+                leaf("text/plain", "second"),
+                {
+                    "mimeType": "multipart/mixed",
+                    "parts": [{"mimeType": "application/pdf", "filename": "a.pdf", "body": {}}],
+                },
+            ],
+        }
+        provider = _provider([])
+
+        message = provider._parse_gmail_message(msg)
+
+        assert message.body_text == "first"
+        assert message.body_html == "<p>first</p>"
+        assert message.has_attachments
+
+
+class TestLabels:
+    """Tests for label lookups."""
+
+    def test_label_listing_is_reused_across_updates(self) -> None:
+        """Labeling several messages lists labels once."""
+        provider = _provider([])
+        labels = provider.service.users().labels().list().execute
+        labels.return_value = {"labels": [{"name": "AI/Work", "id": "Label_1"}]}
+        labels.reset_mock()
+
+        provider.update_labels("m1", {"AI/Work"}, set())
+        provider.update_labels("m2", {"AI/Work"}, set())
+
+        assert labels.call_count == 1
+        provider.service.users().messages().batchModify.assert_called_with(
+            userId="me",
+            body={"ids": ["m2"], "addLabelIds": ["Label_1"], "removeLabelIds": []},
+        )
+
+    def test_batch_update_splits_at_api_limit(self) -> None:
+        """More than BATCH_MODIFY_SIZE messages take one request per chunk."""
+        provider = _provider([])
+        provider.service.users().labels().list().execute.return_value = {
+            "labels": [{"name": "AI/Work", "id": "Label_1"}]
+        }
+        batch_modify = provider.service.users().messages().batchModify
+        message_ids = [f"m{i}" for i in range(GmailProvider.BATCH_MODIFY_SIZE + 1)]
+
+        provider.batch_update_labels(message_ids, {"AI/Work"}, set())
+
+        sent = [call.kwargs["body"]["ids"] for call in batch_modify.call_args_list]
+        assert sent == [message_ids[:-1], message_ids[-1:]]
+
+
+class TestAuthenticate:
+    """Tests for OAuth token handling."""
+
+    def _token(self, expires_in: timedelta) -> dict:
+        return {
+            "access_token": "old",
+            "refresh_token": "refresh",
+            "client_id": "client",
+            "client_secret": "secret",
+            "expiry": datetime.now(timezone.utc) + expires_in,
+        }
+
+    def _authenticate(self, store: dict) -> Mock:
+        """Authenticate two providers sharing one token file; return the refresh mock."""
+
+        def refresh(creds, request) -> None:
+            creds.token = "new"
+            creds.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+
+        def save(path, token_data) -> None:
+            store.update(token_data)
+
+        config = GmailConfig(account_id="acct", email="me@example.com", credential_file="tok")
+        with (
+            patch.object(GmailProvider, "_token_locks", {}),
+            patch(f"{GmailProvider.__module__}.CredLoader") as loader,
+            patch(f"{GmailProvider.__module__}.build"),
+            patch(f"{GmailProvider.__module__}.Credentials.refresh", autospec=True) as refresh_mock,
+        ):
+            loader.load_oauth_token.side_effect = lambda path: dict(store)
+            loader.save_oauth_token.side_effect = save
+            refresh_mock.side_effect = refresh
+            GmailProvider(config).authenticate()
+            GmailProvider(config).authenticate()
+        return refresh_mock
+
+    def test_valid_token_with_aware_expiry_is_not_refreshed(self) -> None:
+        """A stored expiry well in the future skips the token endpoint."""
+        refresh = self._authenticate(self._token(timedelta(hours=1)))
+
+        refresh.assert_not_called()
+
+    def test_refreshed_token_is_saved_and_reused(self) -> None:
+        """A token about to expire is refreshed once and the saved copy reused."""
+        store = self._token(timedelta(seconds=30))
+
+        refresh = self._authenticate(store)
+
+        assert refresh.call_count == 1
+        assert store["access_token"] == "new"
+        assert store["expiry"] > datetime.now(timezone.utc) + timedelta(minutes=50)
+
+
+class TestResponseModel:
+    """Tests for the orjson-backed response model."""
+
+    @pytest.mark.skipif(gmail.orjson is None, reason="orjson not installed")
+    def test_parses_json_and_passes_other_bodies_through(self) -> None:
+        """JSON bodies are decoded; anything else comes back as text like JsonModel."""
+        model = gmail._OrjsonModel()
+
+        assert model.deserialize(b'{"id": "m1", "labelIds": ["INBOX"]}') == {
+            "id": "m1",
+            "labelIds": ["INBOX"],
+        }
+        assert model.deserialize(b"not json") == "not json"
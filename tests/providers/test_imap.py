@@ -0,0 +1,200 @@
+"""Tests for the IMAP provider."""
+
+import email
+from unittest.mock import Mock
+
+from axios_ai_mail.providers.connection_pool import IMAPConnectionPool
+from axios_ai_mail.providers.implementations import imap
+from axios_ai_mail.providers.implementations.imap import IMAPConfig, IMAPProvider
+
+
+def _raw_email(subject: str) -> bytes:
+    return (
+        f"Subject: {subject}\r\nFrom: a@example.com\r\n"
+        'To: "Doe, Jane" <me@example.com>, b@example.com\r\n'
+        "Date: Mon, 1 Jan 2024 10:00:00 +0000\r\n\r\nHello\r\n"
+    ).encode()
+
+
+class TestFetchFromFolder:
+    """Tests for fetching a folder's messages."""
+
+    def test_messages_are_fetched_in_one_command_per_batch(self) -> None:
+        """A single UID FETCH covers the batch, with FLAGS before or after the literal."""
+        provider = IMAPProvider(
+            IMAPConfig(account_id="acct", email="me@example.com", credential_file="", host="imap")
+        )
+        connection = Mock()
+        connection.select.return_value = ("OK", [b"2"])
+        fetch_response = [
+            (b"1 (UID 7 FLAGS (\\Seen $work) BODY[] {100}", _raw_email("first")),
+            b")",
+            (b"2 (UID 9 BODY[] {100}", _raw_email("second")),
+            b" FLAGS ())",
+        ]
+
+        def uid(command, *args):
+            if command == "SEARCH":
+                return "OK", [b"7 9"]
+            return "OK", fetch_response
+
+        connection.uid.side_effect = uid
+        provider.connection = connection
+
+        messages = provider._fetch_from_folder("INBOX")
+
+        fetches = [c.args for c in connection.uid.call_args_list if c.args[0] == "FETCH"]
+        assert fetches == [("FETCH", b"7,9", "(BODY.PEEK[] FLAGS)")]
+        assert [(m.subject, m.is_unread) for m in messages] == [("first", False), ("second", True)]
+        assert "work" in messages[0].labels
+        assert messages[0].to_emails == ['"Doe, Jane" <me@example.com>', "b@example.com"]
+
+    def test_fetches_are_split_by_configured_batch_size(self) -> None:
+        """UIDs past fetch_batch_size go out in a further FETCH command."""
+        provider = IMAPProvider(
+            IMAPConfig(
+                account_id="acct",
+                email="me@example.com",
+                credential_file="",
+                host="imap",
+                fetch_batch_size=2,
+            )
+        )
+        connection = Mock()
+        connection.select.return_value = ("OK", [b"3"])
+        connection.uid.side_effect = lambda command, *args: (
+            ("OK", [b"1 2 3"]) if command == "SEARCH" else ("OK", [])
+        )
+        provider.connection = connection
+
+        provider._fetch_from_folder("INBOX")
+
+        fetched = [c.args[1] for c in connection.uid.call_args_list if c.args[0] == "FETCH"]
+        assert fetched == [b"1,2", b"3"]
+
+    def test_known_messages_are_not_fetched_again(self) -> None:
+        """UIDs whose message IDs are already stored are left out of the FETCH."""
+        provider = IMAPProvider(
+            IMAPConfig(account_id="acct", email="me@example.com", credential_file="", host="imap")
+        )
+        connection = Mock()
+        connection.select.return_value = ("OK", [b"3"])
+        connection.uid.side_effect = lambda command, *args: (
+            ("OK", [b"1 2 3"]) if command == "SEARCH" else ("OK", [])
+        )
+        provider.connection = connection
+
+        provider._fetch_from_folder("INBOX", known_ids={"acct:INBOX:1", "acct:Sent:2"})
+
+        fetched = [c.args[1] for c in connection.uid.call_args_list if c.args[0] == "FETCH"]
+        assert fetched == [b"2,3"]
+
+    def test_esearch_result_is_expanded_from_the_newest_uids(self) -> None:
+        """With ESEARCH only the last max_results UIDs of the compact set are fetched."""
+        provider = IMAPProvider(
+            IMAPConfig(account_id="acct", email="me@example.com", credential_file="", host="imap")
+        )
+        provider._supports_esearch = True
+        connection = Mock()
+        connection.select.return_value = ("OK", [b"3"])
+        connection.uid.return_value = ("OK", [])
+        connection.response.return_value = ("ESEARCH", [b'(TAG "A3") UID ALL 1:50,100:102'])
+        provider.connection = connection
+
+        provider._fetch_from_folder("INBOX", max_results=5)
+
+        searches = [c.args for c in connection.uid.call_args_list if c.args[0] == "SEARCH"]
+        fetched = [c.args[1] for c in connection.uid.call_args_list if c.args[0] == "FETCH"]
+        assert searches == [("SEARCH", "RETURN (ALL)", "ALL")]
+        assert fetched == [b"49,50,100,101,102"]
+
+
+class TestExtractBody:
+    """Tests for pulling text and HTML bodies out of messages."""
+
+    def test_html_only_message_gets_readable_text(self) -> None:
+        """Script and style content and entities don't leak into the text body."""
+        provider = IMAPProvider(
+            IMAPConfig(account_id="acct", email="me@example.com", credential_file="", host="imap")
+        )
+        message = email.message_from_bytes(
+            b"Content-Type: text/html; charset=utf-8\r\n\r\n"
+            b"<html><head><style>p { color: red; }</style></head>"
+            b"<body><p>Fish&nbsp;&amp;&nbsp;chips</p><script>track()</script></body></html>"
+        )
+
+        body_text, body_html = provider._extract_body(message)
+
+        assert body_text == "Fish\xa0&\xa0chips"
+        assert body_html.startswith("<html>")
+
+    def test_declared_charset_is_used(self) -> None:
+        """A windows-1252 body decodes smart quotes instead of latin-1 control characters."""
+        provider = IMAPProvider(
+            IMAPConfig(account_id="acct", email="me@example.com", credential_file="", host="imap")
+        )
+        message = email.message_from_bytes(
+            b"Content-Type: text/plain; charset=windows-1252\r\n\r\n\x93quoted\x94"
+        )
+
+        body_text, _ = provider._extract_body(message)
+
+        assert body_text == "\u201cquoted\u201d"
+
+
+class TestFetchMessages:
+    """Tests for syncing across folders."""
+
+    def test_other_folders_are_fetched_on_a_pooled_connection(self, monkeypatch) -> None:
+        """Folders after the first run on a borrowed connection that goes back to the pool."""
+        pool = IMAPConnectionPool(keepalive_interval=None)
+        monkeypatch.setattr(imap, "get_connection_pool", lambda: pool)
+        provider = IMAPProvider(
+            IMAPConfig(account_id="acct", email="me@example.com", credential_file="", host="imap")
+        )
+        provider.list_folders = lambda: ["INBOX", "Sent"]
+        provider._discover_folder_mapping = lambda folders: {"inbox": "INBOX", "sent": "Sent"}
+
+        def connection(uid: bytes, subject: str) -> Mock:
+            conn = Mock()
+            conn.select.return_value = ("OK", [b"1"])
+            conn.uid.side_effect = lambda command, *args: (
+                ("OK", [uid])
+                if command == "SEARCH"
+                else ("OK", [(b"1 (UID " + uid + b" BODY[] {100}", _raw_email(subject)), b")"])
+            )
+            return conn
+
+        provider.connection = connection(b"1", "inbox")
+        borrowed = connection(b"2", "sent")
+        provider.create_connection = lambda: borrowed
+
+        messages = provider.fetch_messages()
+
+        assert sorted(m.subject for m in messages) == ["inbox", "sent"]
+        borrowed.select.assert_called_once_with("Sent")
+        assert pool.get_stats()["in_use"] == 0
+
+
+class TestUpdateLabels:
+    """Tests for pushing tags as IMAP keywords."""
+
+    def test_batch_stores_once_per_folder(self) -> None:
+        """Messages sharing a folder get one UID STORE per direction."""
+        provider = IMAPProvider(
+            IMAPConfig(account_id="acct", email="me@example.com", credential_file="", host="imap")
+        )
+        provider._supports_keywords = True
+        provider.connection = Mock()
+        provider.connection.select.return_value = ("OK", [b"1"])
+
+        provider.batch_update_labels(
+            ["acct:INBOX:1", "acct:INBOX:5", "acct:Sent:2"], {"work"}, {"todo"}
+        )
+
+        assert [c.args for c in provider.connection.uid.call_args_list] == [
+            ("STORE", "1,5", "+FLAGS", "($work)"),
+            ("STORE", "1,5", "-FLAGS", "($todo)"),
+            ("STORE", "2", "+FLAGS", "($work)"),
+            ("STORE", "2", "-FLAGS", "($todo)"),
+        ]
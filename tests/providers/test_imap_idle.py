@@ -0,0 +1,156 @@
+"""Tests for the IMAP IDLE watcher."""
+
+import socket
+import threading
+import time
+
+from axios_ai_mail.providers.imap_idle import (
+    IdleConfig,
+    IMAPIdleConnection,
+    MultiplexedIdleRunner,
+)
+
+
+class FakeIdleServer:
+    """IMAP connection stand-in backed by a real socket pair.
+
+    Reads go through a buffered file object, as with imaplib, so several
+    lines pushed in one packet land in the client-side buffer together.
+    """
+
+    def __init__(self) -> None:
+        self.server_sock, self.client_sock = socket.socketpair()
+        self.file = self.client_sock.makefile("rb")
+        self.sent: list[bytes] = []
+        self.logged_out = False
+
+    def _new_tag(self) -> bytes:
+        return b"A1"
+
+    def socket(self) -> socket.socket:
+        return self.client_sock
+
+    def send(self, data: bytes) -> None:
+        self.sent.append(data)
+        if data.endswith(b" IDLE\r\n"):
+            self.push(b"+ idling\r\n")
+        elif data == b"DONE\r\n":
+            self.push(b"A1 OK IDLE terminated\r\n")
+
+    def readline(self) -> bytes:
+        return self.file.readline()
+
+    def noop(self):
+        return "OK", [b""]
+
+    def logout(self) -> None:
+        self.logged_out = True
+
+    def push(self, data: bytes) -> None:
+        self.server_sock.sendall(data)
+
+
+def _start_watcher(server: FakeIdleServer, on_new_mail) -> IMAPIdleConnection:
+    config = IdleConfig(
+        account_id="acct", email="me@example.com", host="imap", port=993, credential_file=""
+    )
+    watcher = IMAPIdleConnection(config, on_new_mail)
+
+    def connect() -> bool:
+        watcher._connection = server
+        return True
+
+    watcher._connect = connect
+    watcher.start()
+    deadline = time.monotonic() + 5
+    while server.sent.count(b"A1 IDLE\r\n") < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return watcher
+
+
+class TestIMAPIdleConnection:
+    """Tests for the IDLE watch loop."""
+
+    def test_exists_behind_another_push_in_same_packet_is_reported(self) -> None:
+        """A second untagged line buffered with the first is not left unread."""
+        server = FakeIdleServer()
+        notified = threading.Event()
+        watcher = _start_watcher(server, lambda account_id: notified.set())
+        try:
+            server.push(b"* 3 EXPUNGE\r\n* 22 EXISTS\r\n")
+
+            assert notified.wait(5)
+        finally:
+            watcher.stop()
+
+    def test_expunge_is_consumed_without_leaving_idle(self) -> None:
+        """Pushes other than EXISTS don't cost a DONE/IDLE round-trip."""
+        server = FakeIdleServer()
+        calls: list[str] = []
+        watcher = _start_watcher(server, calls.append)
+        try:
+            server.push(b"* 3 EXPUNGE\r\n")
+            time.sleep(0.2)
+
+            assert b"DONE\r\n" not in server.sent
+            assert calls == []
+        finally:
+            watcher.stop()
+
+    def test_stop_wakes_watcher_and_logs_out(self) -> None:
+        """stop() returns promptly and the watcher leaves IDLE before logging out."""
+        server = FakeIdleServer()
+        watcher = _start_watcher(server, lambda account_id: None)
+
+        started = time.monotonic()
+        watcher.stop()
+
+        assert time.monotonic() - started < 2
+        assert server.sent[-1] == b"DONE\r\n"
+        assert server.logged_out
+
+
+class TestMultiplexedIdleRunner:
+    """Tests for watching several accounts from one thread."""
+
+    def test_accounts_share_one_thread_and_report_their_own_mail(self) -> None:
+        """Pushes on any socket reach that account's callback via the runner thread."""
+        servers = {"a": FakeIdleServer(), "b": FakeIdleServer()}
+        notified: list[tuple[str, str]] = []
+        got_mail = threading.Event()
+
+        def on_new_mail(account_id: str) -> None:
+            notified.append((account_id, threading.current_thread().name))
+            got_mail.set()
+
+        runner = MultiplexedIdleRunner()
+        for account_id, server in servers.items():
+            config = IdleConfig(
+                account_id=account_id,
+                email=f"{account_id}@example.com",
+                host="imap",
+                port=993,
+                credential_file="",
+            )
+            connection = IMAPIdleConnection(config, on_new_mail)
+            connection._connect = (
+                lambda c=connection, s=server: setattr(c, "_connection", s) or True
+            )
+            runner.add_account(connection)
+        runner.start()
+        try:
+            deadline = time.monotonic() + 5
+            while (
+                any(b"A1 IDLE\r\n" not in s.sent for s in servers.values())
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+
+            servers["b"].push(b"* 7 EXISTS\r\n")
+
+            assert got_mail.wait(5)
+            assert notified == [("b", "imap-idle-runner")]
+        finally:
+            runner.stop()
+
+        assert all(s.logged_out for s in servers.values())